@@ -20,6 +20,7 @@ from src.core.constants import (
 )
 from src.core.telemetry import (
     get_tracer,
+    is_tracing_enabled,
     setup_telemetry,
     trace_function,
     traced_operation,
@@ -32,6 +33,7 @@ __all__ = [
     # Telemetry
     "setup_telemetry",
     "get_tracer",
+    "is_tracing_enabled",
     "traced_operation",
     "trace_function",
     # Constants
@@ -3,13 +3,24 @@ Constants and configuration values for CopForge.
 
 Centralized definitions for sensor types, classifications, access levels,
 and other configuration that needs to be consistent across the system.
+
+Lookup sets are immutable frozensets of interned strings, so membership
+tests on the validation hot path are constant-time hash probes.
 """
 
+import sys
+
+
+def _interned_set(*values: str) -> frozenset[str]:
+    """Build a frozenset of interned strings."""
+    return frozenset(map(sys.intern, values))
+
+
 # =============================================================================
 # Sensor Types
 # =============================================================================
 
-SENSOR_TYPES: set[str] = {
+SENSOR_TYPES: frozenset[str] = _interned_set(
     "radar",
     "drone",
     "manual",
@@ -21,18 +32,18 @@ SENSOR_TYPES: set[str] = {
     "sigint",
     "imint",
     "other",
-}
+)
 
 # =============================================================================
 # IFF Classifications (Identification Friend or Foe)
 # =============================================================================
 
-CLASSIFICATIONS: set[str] = {
+CLASSIFICATIONS: frozenset[str] = _interned_set(
     "friendly",
     "hostile",
     "neutral",
     "unknown",
-}
+)
 
 # =============================================================================
 # Information Classification Levels (Security)
@@ -47,7 +58,7 @@ CLASSIFICATION_LEVELS: list[str] = [
     "UNCLASSIFIED",
 ]
 
-CLASSIFICATION_LEVEL_SET: set[str] = set(CLASSIFICATION_LEVELS)
+CLASSIFICATION_LEVEL_SET: frozenset[str] = _interned_set(*CLASSIFICATION_LEVELS)
 
 # Numeric hierarchy for comparison (higher = more restricted)
 CLASSIFICATION_HIERARCHY: dict[str, int] = {
@@ -62,14 +73,14 @@ CLASSIFICATION_HIERARCHY: dict[str, int] = {
 # Access Levels (for dissemination control)
 # =============================================================================
 
-ACCESS_LEVELS: set[str] = {
+ACCESS_LEVELS: frozenset[str] = _interned_set(
     "top_secret_access",
     "secret_access",
     "confidential_access",
     "restricted_access",
     "unclassified_access",
     "enemy_access",  # Special: for deception operations
-}
+)
 
 # Mapping of access level to maximum classification it can read
 ACCESS_TO_MAX_CLASSIFICATION: dict[str, str] = {
@@ -85,7 +96,7 @@ ACCESS_TO_MAX_CLASSIFICATION: dict[str, str] = {
 # Entity Types
 # =============================================================================
 
-ENTITY_TYPES: set[str] = {
+ENTITY_TYPES: frozenset[str] = _interned_set(
     # Air
     "aircraft",
     "fighter",
@@ -111,7 +122,7 @@ ENTITY_TYPES: set[str] = {
     "person",
     "event",
     "unknown",
-}
+)
 
 # =============================================================================
 # Helper Functions
@@ -229,6 +229,29 @@ def get_tracer(name: str) -> Any:
         return _NoOpTracer()
 
 
+def is_tracing_enabled() -> bool:
+    """
+    Check whether an OpenTelemetry tracer provider has been configured.
+
+    Hot paths can use this to skip span creation entirely when no spans
+    would be exported. Providers installed globally by the host application
+    (or a2a-sdk) count as well as the one from setup_opentelemetry().
+
+    Returns:
+        True if a real tracer provider is installed, False for the default
+        proxy/no-op provider or when OpenTelemetry is not installed.
+    """
+    if _tracer_provider is not None:
+        return True
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return False
+    return not isinstance(
+        trace.get_tracer_provider(), trace.ProxyTracerProvider | trace.NoOpTracerProvider
+    )
+
+
 @contextmanager
 def traced_operation(
     tracer: Any,
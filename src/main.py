@@ -27,7 +27,13 @@ from src.mcp_client import CopFusionClient, MCPClientError
 from src.models.cop import EntityCOP
 from src.models.sensor import SensorMessage
 from src.parsers import ParseResult, get_parser_factory
-from src.security.firewall import FirewallResult, validate_entity, validate_sensor_input
+from src.security.firewall import (
+    AuthorizedSensors,
+    FirewallResult,
+    build_sensor_auth_index,
+    validate_entity,
+    validate_sensor_input,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -77,7 +83,7 @@ class IngestResult:
 async def ingest_sensor_message(
     sensor_msg: SensorMessage,
     client: CopFusionClient,
-    authorized_sensors: dict[str, dict[str, Any]] | None = None,
+    authorized_sensors: AuthorizedSensors | None = None,
     strict_mode: bool = True,
 ) -> IngestResult:
     """
@@ -114,6 +120,7 @@ async def ingest_sensor_message(
                 sensor_msg,
                 authorized_sensors=authorized_sensors,
                 strict_mode=strict_mode,
+                collect_details=True,
             )
             fw_span.set_attribute("firewall.passed", firewall_result.is_valid)
 
@@ -124,7 +131,7 @@ async def ingest_sensor_message(
                 success=False,
                 stage="firewall",
                 error=firewall_result.error,
-                details=firewall_result.details,
+                details=dict(firewall_result.details),
             )
 
         if firewall_result.warnings:
@@ -251,8 +258,13 @@ async def ingest_batch(
         entities_created = 0
         errors: list[dict[str, str]] = []
 
+        # Flatten the whitelist once for the whole batch
+        auth_index = (
+            build_sensor_auth_index(authorized_sensors) if authorized_sensors is not None else None
+        )
+
         for msg in messages:
-            result = await ingest_sensor_message(msg, client, authorized_sensors)
+            result = await ingest_sensor_message(msg, client, auth_index)
             if result.success:
                 success += 1
                 entities_created += len(result.entities)
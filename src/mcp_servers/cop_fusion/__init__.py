@@ -14,6 +14,7 @@ from src.mcp_servers.cop_fusion.state import COPState, get_cop_state, reset_cop_
 from src.mcp_servers.cop_fusion.tools import (
     check_mapa_connection,
     find_duplicates,
+    find_duplicates_entity,
     get_cop_stats,
     haversine_distance,
     load_from_mapa,
@@ -37,6 +38,7 @@ __all__ = [
     "get_cop_sync",
     "reset_cop_sync",
     "find_duplicates",
+    "find_duplicates_entity",
     "merge_entities",
     "update_cop",
     "query_cop",
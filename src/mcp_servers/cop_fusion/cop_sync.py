@@ -8,7 +8,7 @@ from typing import Any
 
 from src.core.telemetry import get_tracer, traced_operation
 from src.mcp_servers.cop_fusion.mapa_client import MapaClient, MapaClientError, get_mapa_client
-from src.models.cop import EntityCOP, Location
+from src.models.cop import EntityCOP, Location, parse_iso_timestamp
 
 logger = logging.getLogger(__name__)
 tracer = get_tracer("copforge.mcp.cop_fusion.sync")
@@ -77,11 +77,7 @@ def punto_to_entity(punto: dict[str, Any]) -> EntityCOP:
     """Convert mapa punto to EntityCOP."""
     timestamp_str = punto.get("timestamp")
     try:
-        timestamp = (
-            datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            if timestamp_str
-            else datetime.now(UTC)
-        )
+        timestamp = parse_iso_timestamp(timestamp_str) if timestamp_str else datetime.now(UTC)
     except ValueError:
         timestamp = datetime.now(UTC)
 
@@ -3,9 +3,13 @@ COP State Management with mapa-puntos-interes integration.
 """
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from threading import Lock
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
 
 from src.core.telemetry import get_tracer, traced_operation
 from src.models.cop import COPSnapshot, EntityCOP, ThreatAssessment
@@ -17,6 +21,213 @@ logger = logging.getLogger(__name__)
 tracer = get_tracer("copforge.mcp.cop_fusion.state")
 
 
+class CoordinateIndex(NamedTuple):
+    """Positions of one entity type, sorted by latitude.
+
+    Never modified in place: adding or removing an entity returns a new index,
+    so readers can keep using the one they fetched without holding the lock.
+    ``seqs`` records each entity's insertion rank to report matches in
+    insertion order.
+    """
+
+    entities: list[EntityCOP]
+    lats: np.ndarray
+    lons: np.ndarray
+    seqs: np.ndarray
+
+    @classmethod
+    def build(cls, entities: list[EntityCOP], seqs: list[int]) -> "CoordinateIndex":
+        lats = np.fromiter((e.location.lat for e in entities), np.float64, len(entities))
+        lons = np.fromiter((e.location.lon for e in entities), np.float64, len(entities))
+        order = np.argsort(lats, kind="stable")
+        return cls(
+            [entities[i] for i in order.tolist()],
+            lats[order],
+            lons[order],
+            np.asarray(seqs, dtype=np.int64)[order],
+        )
+
+    def within_lat_band(self, lat: float, delta_deg: float) -> np.ndarray:
+        """Indices with |lat - lat_i| <= delta_deg, in insertion order."""
+        lo = np.searchsorted(self.lats, lat - delta_deg, side="left")
+        hi = np.searchsorted(self.lats, lat + delta_deg, side="right")
+        return lo + np.argsort(self.seqs[lo:hi], kind="stable")
+
+    def position(self, entity_id: str, lat: float) -> int:
+        """Index of the entity stored at ``lat``."""
+        lo = int(np.searchsorted(self.lats, lat, side="left"))
+        hi = int(np.searchsorted(self.lats, lat, side="right"))
+        for i in range(lo, hi):
+            if self.entities[i].entity_id == entity_id:
+                return i
+        raise KeyError(entity_id)
+
+    def inserted(self, entity: EntityCOP, seq: int) -> "CoordinateIndex":
+        """Copy of the index with ``entity`` added at its latitude."""
+        lat = entity.location.lat
+        i = int(np.searchsorted(self.lats, lat, side="right"))
+        return CoordinateIndex(
+            [*self.entities[:i], entity, *self.entities[i:]],
+            np.insert(self.lats, i, lat),
+            np.insert(self.lons, i, entity.location.lon),
+            np.insert(self.seqs, i, seq),
+        )
+
+    def removed(self, i: int) -> "CoordinateIndex":
+        """Copy of the index without the entity at index ``i``."""
+        return CoordinateIndex(
+            [*self.entities[:i], *self.entities[i + 1 :]],
+            np.delete(self.lats, i),
+            np.delete(self.lons, i),
+            np.delete(self.seqs, i),
+        )
+
+    def merged(
+        self, drop: set[str], entities: list[EntityCOP], seqs: list[int]
+    ) -> "CoordinateIndex":
+        """Copy of the index without the ``drop`` IDs and with ``entities`` added.
+
+        Rebuilt in one pass, so a batch costs one sort of the bucket instead of
+        one copy per entity.
+        """
+        keep = np.fromiter(
+            (e.entity_id not in drop for e in self.entities), bool, len(self.entities)
+        )
+        return CoordinateIndex.build(
+            [e for e, kept in zip(self.entities, keep.tolist(), strict=True) if kept] + entities,
+            self.seqs[keep].tolist() + seqs,
+        )
+
+
+class EntityColumns:
+    """Column view of all entities (insertion order) for vectorized filtering.
+
+    Kept in step with the entity dict: an add appends a row, an update patches
+    its row in place and a removal clears the row's ``alive`` flag. Dead rows
+    are compacted away once they outnumber the live ones.
+    """
+
+    _MIN_CAPACITY = 64
+
+    def __init__(self, capacity: int = _MIN_CAPACITY) -> None:
+        capacity = max(capacity, self._MIN_CAPACITY)
+        self.rows: dict[str, int] = {}
+        self.entities: list[EntityCOP] = []
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._entity_types = np.empty(capacity, dtype=object)
+        self._classifications = np.empty(capacity, dtype=object)
+        self._confidences = np.zeros(capacity, dtype=np.float64)
+        self._lats = np.zeros(capacity, dtype=np.float64)
+        self._lons = np.zeros(capacity, dtype=np.float64)
+
+    @classmethod
+    def build(cls, entities: list[EntityCOP]) -> "EntityColumns":
+        count = len(entities)
+        columns = cls(count)
+        columns.rows = {e.entity_id: i for i, e in enumerate(entities)}
+        columns.entities = list(entities)
+        columns._alive[:count] = True
+        columns._entity_types[:count] = [e.entity_type for e in entities]
+        columns._classifications[:count] = [e.classification for e in entities]
+        columns._confidences[:count] = [e.confidence for e in entities]
+        columns._lats[:count] = [e.location.lat for e in entities]
+        columns._lons[:count] = [e.location.lon for e in entities]
+        return columns
+
+    def __len__(self) -> int:
+        """Number of live entities."""
+        return len(self.rows)
+
+    # Views over the rows in use; dead rows have alive == False
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[: len(self.entities)]
+
+    @property
+    def entity_types(self) -> np.ndarray:
+        return self._entity_types[: len(self.entities)]
+
+    @property
+    def classifications(self) -> np.ndarray:
+        return self._classifications[: len(self.entities)]
+
+    @property
+    def confidences(self) -> np.ndarray:
+        return self._confidences[: len(self.entities)]
+
+    @property
+    def lats(self) -> np.ndarray:
+        return self._lats[: len(self.entities)]
+
+    @property
+    def lons(self) -> np.ndarray:
+        return self._lons[: len(self.entities)]
+
+    def _write_row(self, row: int, entity: EntityCOP) -> None:
+        self._alive[row] = True
+        self._entity_types[row] = entity.entity_type
+        self._classifications[row] = entity.classification
+        self._confidences[row] = entity.confidence
+        self._lats[row] = entity.location.lat
+        self._lons[row] = entity.location.lon
+
+    def _resize(self, capacity: int) -> None:
+        for name in (
+            "_alive",
+            "_entity_types",
+            "_classifications",
+            "_confidences",
+            "_lats",
+            "_lons",
+        ):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(self.entities)] = old[: len(self.entities)]
+            setattr(self, name, new)
+
+    def put(self, entity: EntityCOP) -> None:
+        """Patch the entity's row in place, or append a new one."""
+        row = self.rows.get(entity.entity_id)
+        if row is None:
+            row = len(self.entities)
+            if row == self._alive.size:
+                self._resize(2 * row)
+            self.rows[entity.entity_id] = row
+            self.entities.append(entity)
+        else:
+            self.entities[row] = entity
+        self._write_row(row, entity)
+
+    def remove(self, entity_id: str) -> None:
+        """Mark the entity's row dead, compacting when dead rows dominate."""
+        row = self.rows.pop(entity_id, None)
+        if row is None:
+            return
+        self._alive[row] = False
+        dead = len(self.entities) - len(self.rows)
+        if dead > self._MIN_CAPACITY and dead > len(self.rows):
+            self._compact()
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self.alive)
+        count = keep.size
+        for name in (
+            "_entity_types",
+            "_classifications",
+            "_confidences",
+            "_lats",
+            "_lons",
+        ):
+            column = getattr(self, name)
+            column[:count] = column[keep]
+        self._alive[:count] = True
+        self._alive[count:] = False
+        self._entity_types[count:] = None
+        self._classifications[count:] = None
+        self.entities = [self.entities[i] for i in keep.tolist()]
+        self.rows = {e.entity_id: i for i, e in enumerate(self.entities)}
+
+
 class COPState:
     """Thread-safe COP state with mapa-puntos-interes sync."""
 
@@ -28,6 +239,13 @@ class COPState:
     ) -> None:
         self._lock = Lock()
         self._entities: dict[str, EntityCOP] = {}
+        # Derived views, updated alongside every mutation. The spatial index is
+        # built on first use; _indexed remembers where each entity was filed
+        # (type, lat, insertion rank) so it can be found again after an update.
+        self._spatial_index: dict[str, CoordinateIndex] | None = None
+        self._indexed: dict[str, tuple[str, float, int]] = {}
+        self._next_seq = 0
+        self._columns = EntityColumns()
         self._threat_assessments: list[ThreatAssessment] = []
         self._snapshots: list[COPSnapshot] = []
         self._created_at = datetime.now(UTC)
@@ -52,6 +270,103 @@ class COPState:
         with self._lock:
             return self._entities.copy()
 
+    def _rebuild_indexes(self) -> None:
+        """Reset derived views after a bulk replace; callers must hold the lock."""
+        self._spatial_index = None
+        self._indexed = {}
+        self._columns = EntityColumns.build(list(self._entities.values()))
+
+    def _index_remove(self, entity_id: str) -> int | None:
+        """Drop an entity from its type bucket, returning its insertion rank."""
+        filed = self._indexed.pop(entity_id, None)
+        if self._spatial_index is None or filed is None:
+            return None
+        entity_type, lat, seq = filed
+        bucket = self._spatial_index[entity_type]
+        if len(bucket.entities) == 1:
+            del self._spatial_index[entity_type]
+        else:
+            self._spatial_index[entity_type] = bucket.removed(bucket.position(entity_id, lat))
+        return seq
+
+    def _index_put(self, entity: EntityCOP) -> None:
+        """File an added or updated entity in the spatial index; callers must hold the lock."""
+        if self._spatial_index is None:
+            return
+        seq = self._index_remove(entity.entity_id)
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        bucket = self._spatial_index.get(entity.entity_type)
+        self._spatial_index[entity.entity_type] = (
+            bucket.inserted(entity, seq)
+            if bucket is not None
+            else CoordinateIndex.build([entity], [seq])
+        )
+        self._indexed[entity.entity_id] = (entity.entity_type, entity.location.lat, seq)
+
+    def _index_put_many(self, entities: list[EntityCOP]) -> None:
+        """File a batch, rebuilding each touched bucket once; callers must hold the lock."""
+        if self._spatial_index is None:
+            return
+        drop: dict[str, set[str]] = {}
+        added: dict[str, tuple[list[EntityCOP], list[int]]] = {}
+        # Keys keep first-appearance order (which fixes new insertion ranks),
+        # values the last write for an ID repeated in the batch
+        latest = {entity.entity_id: entity for entity in entities}
+        for entity_id, entity in latest.items():
+            filed = self._indexed.get(entity_id)
+            if filed is None:
+                seq = self._next_seq
+                self._next_seq += 1
+            else:
+                seq = filed[2]
+                drop.setdefault(filed[0], set()).add(entity_id)
+            bucket_entities, seqs = added.setdefault(entity.entity_type, ([], []))
+            bucket_entities.append(entity)
+            seqs.append(seq)
+            self._indexed[entity_id] = (entity.entity_type, entity.location.lat, seq)
+        for entity_type in drop.keys() | added.keys():
+            bucket_entities, seqs = added.get(entity_type, ([], []))
+            bucket = self._spatial_index.get(entity_type)
+            merged = (
+                bucket.merged(drop.get(entity_type, set()), bucket_entities, seqs)
+                if bucket is not None
+                else CoordinateIndex.build(bucket_entities, seqs)
+            )
+            if merged.entities:
+                self._spatial_index[entity_type] = merged
+            else:
+                del self._spatial_index[entity_type]
+
+    @contextmanager
+    def entity_columns(self) -> Iterator[EntityColumns]:
+        """Hold the lock and yield the column view of all entities."""
+        with self._lock:
+            yield self._columns
+
+    def coordinate_index(self, entity_type: str) -> CoordinateIndex | None:
+        """Return the coordinate index for one entity type, if any exist."""
+        with self._lock:
+            if self._spatial_index is None:
+                buckets: dict[str, tuple[list[EntityCOP], list[int]]] = {}
+                self._indexed = {}
+                for seq, entity in enumerate(self._entities.values()):
+                    bucket, seqs = buckets.setdefault(entity.entity_type, ([], []))
+                    bucket.append(entity)
+                    seqs.append(seq)
+                    self._indexed[entity.entity_id] = (
+                        entity.entity_type,
+                        entity.location.lat,
+                        seq,
+                    )
+                self._next_seq = len(self._entities)
+                self._spatial_index = {
+                    etype: CoordinateIndex.build(bucket, seqs)
+                    for etype, (bucket, seqs) in buckets.items()
+                }
+            return self._spatial_index.get(entity_type)
+
     @property
     def threat_assessments(self) -> list[ThreatAssessment]:
         with self._lock:
@@ -77,6 +392,7 @@ class COPState:
                 self._entities.clear()
                 for entity in entities:
                     self._entities[entity.entity_id] = entity
+                self._rebuild_indexes()
                 self._last_updated = datetime.now(UTC)
             logger.info(f"Loaded {len(entities)} entities from mapa")
             span.set_attribute("mapa.loaded", len(entities))
@@ -92,6 +408,16 @@ class COPState:
         except Exception as e:
             logger.warning(f"Error syncing to mapa: {e}")
 
+    def _sync_batch_to_mapa(self, entities: list[EntityCOP]) -> None:
+        if not self._auto_sync or not entities:
+            return
+        try:
+            result = self.sync.sync_batch(entities)
+            if not result.get("success") or result.get("failed"):
+                logger.warning(f"Failed to sync batch to mapa: {result.get('errors')}")
+        except Exception as e:
+            logger.warning(f"Error syncing batch to mapa: {e}")
+
     def _remove_from_mapa(self, entity_id: str) -> None:
         if not self._auto_sync:
             return
@@ -112,6 +438,8 @@ class COPState:
                 if entity.entity_id in self._entities:
                     return False
                 self._entities[entity.entity_id] = entity
+                self._columns.put(entity)
+                self._index_put(entity)
                 self._last_updated = datetime.now(UTC)
             self._sync_to_mapa(entity)
             return True
@@ -122,6 +450,8 @@ class COPState:
                 if entity.entity_id not in self._entities:
                     return False
                 self._entities[entity.entity_id] = entity
+                self._columns.put(entity)
+                self._index_put(entity)
                 self._last_updated = datetime.now(UTC)
             self._sync_to_mapa(entity)
             return True
@@ -131,17 +461,36 @@ class COPState:
             with self._lock:
                 action = "updated" if entity.entity_id in self._entities else "added"
                 self._entities[entity.entity_id] = entity
+                self._columns.put(entity)
+                self._index_put(entity)
                 self._last_updated = datetime.now(UTC)
                 span.set_attribute("cop.action", action)
             self._sync_to_mapa(entity)
             return action
 
+    def upsert_entities(self, entities: list[EntityCOP]) -> list[str]:
+        """Add or update entities under one lock, then sync them as one batch."""
+        with traced_operation(tracer, "upsert_entities", {"entities_count": len(entities)}):
+            actions: list[str] = []
+            with self._lock:
+                for entity in entities:
+                    actions.append("updated" if entity.entity_id in self._entities else "added")
+                    self._entities[entity.entity_id] = entity
+                    self._columns.put(entity)
+                self._index_put_many(entities)
+                if entities:
+                    self._last_updated = datetime.now(UTC)
+            self._sync_batch_to_mapa(entities)
+            return actions
+
     def remove_entity(self, entity_id: str) -> bool:
         with traced_operation(tracer, "remove_entity", {"entity_id": entity_id}):
             with self._lock:
                 if entity_id not in self._entities:
                     return False
                 del self._entities[entity_id]
+                self._columns.remove(entity_id)
+                self._index_remove(entity_id)
                 self._last_updated = datetime.now(UTC)
             self._remove_from_mapa(entity_id)
             return True
@@ -180,6 +529,7 @@ class COPState:
             self._lock,
         ):
             self._entities = snapshot.entities.copy()
+            self._rebuild_indexes()
             self._threat_assessments = snapshot.threat_assessments.copy()
             self._last_updated = datetime.now(UTC)
 
@@ -228,6 +578,7 @@ class COPState:
                 "snapshots": len(self._snapshots),
             }
             self._entities.clear()
+            self._rebuild_indexes()
             self._threat_assessments.clear()
             self._snapshots.clear()
             self._last_updated = datetime.now(UTC)
@@ -2,13 +2,28 @@
 COP Fusion Tools - Deterministic operations for COP management.
 """
 
+import json
 import math
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
+
 from src.core.telemetry import get_tracer, traced_operation
 from src.mcp_servers.cop_fusion.state import COPState
-from src.models.cop import EntityCOP, Location
+from src.models.cop import EntityCOP, Location, parse_iso_timestamp
+
+try:
+    import orjson
+
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:  # orjson is an optional speedup (copforge[perf])
+    _json_loads = json.loads
+
+# Validates a whole update batch in one pydantic-core call
+_ENTITY_LIST_ADAPTER: TypeAdapter[list[EntityCOP]] = TypeAdapter(list[EntityCOP])
 
 tracer = get_tracer("copforge.mcp.cop_fusion.tools")
 
@@ -17,6 +32,9 @@ DEFAULT_TIME_WINDOW_SEC = 300
 MULTI_SENSOR_CONFIDENCE_BOOST = 0.1
 MAX_CONFIDENCE = 0.99
 EARTH_RADIUS_M = 6_371_000
+# Equirectangular prefilter is only used where its error bound stays tight
+APPROX_MAX_LATITUDE_DEG = 80.0
+APPROX_MAX_DISTANCE_M = 100_000
 
 
 def haversine_distance(loc1: Location, loc2: Location) -> float:
@@ -28,50 +46,122 @@ def haversine_distance(loc1: Location, loc2: Location) -> float:
     return EARTH_RADIUS_M * 2 * math.asin(math.sqrt(a))
 
 
-def find_duplicates(
+def _haversine_batch(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Haversine distances in meters from one point to arrays of points."""
+    lat1, lon1 = math.radians(lat0), math.radians(lon0)
+    lat2, lon2 = np.radians(lats), np.radians(lons)
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return EARTH_RADIUS_M * 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def _approx_distance_m(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Equirectangular distances in meters from one point (cos(lat0) computed once)."""
+    cos_lat0 = math.cos(math.radians(lat0))
+    dlat = lats - lat0
+    dlon = (lons - lon0 + 180.0) % 360.0 - 180.0  # shortest way across the antimeridian
+    return EARTH_RADIUS_M * np.radians(np.sqrt(dlat * dlat + (cos_lat0 * dlon) ** 2))
+
+
+def _lat_band_deg(distance_m: float) -> float:
+    """Latitude span (degrees, with float slack) covering distance_m along a meridian."""
+    return math.degrees(distance_m / EARTH_RADIUS_M) * (1 + 1e-9) + 1e-9
+
+
+def _approx_radius_m(lat0: float, distance_m: float) -> float | None:
+    """
+    Inflated radius for the equirectangular prefilter, or None where it is unsafe.
+
+    Within the latitude band, cos(lat) >= cos(|lat0| + band), so scaling by the
+    ratio to cos(lat0) (plus a small margin for the small-angle error) keeps
+    every point within distance_m by Haversine inside the prefilter radius.
+    Close to the poles or for large radii the bound degrades, so the caller
+    falls back to exact Haversine on the whole band.
+    """
+    edge_deg = abs(lat0) + _lat_band_deg(distance_m)
+    if edge_deg > APPROX_MAX_LATITUDE_DEG or distance_m > APPROX_MAX_DISTANCE_M:
+        return None
+    cos_ratio = math.cos(math.radians(lat0)) / math.cos(math.radians(edge_deg))
+    return distance_m * cos_ratio * 1.001 + 1e-6
+
+
+def _find_duplicates_core(
+    cop_state: COPState,
+    entity_id: str,
+    entity_type: str,
+    classification: str,
+    lat: float,
+    lon: float,
+    timestamp: datetime,
+    distance_threshold_m: float,
+    time_window_sec: float,
+) -> list[dict[str, Any]]:
+    """Score same-type, same-classification entities near a position, best first."""
+    index = cop_state.coordinate_index(entity_type)
+    if index is None:
+        return []
+    # Great-circle distance is never shorter than the latitude difference
+    candidates = index.within_lat_band(lat, _lat_band_deg(distance_threshold_m))
+    approx_radius_m = _approx_radius_m(lat, distance_threshold_m)
+    if approx_radius_m is not None and candidates.size:
+        approx = _approx_distance_m(lat, lon, index.lats[candidates], index.lons[candidates])
+        candidates = candidates[approx <= approx_radius_m]
+    distances = _haversine_batch(lat, lon, index.lats[candidates], index.lons[candidates])
+
+    matches: list[dict[str, Any]] = []
+    for i, distance_m in zip(candidates.tolist(), distances.tolist(), strict=True):
+        if distance_m > distance_threshold_m:
+            continue
+        existing = index.entities[i]
+        existing_id = existing.entity_id
+        if existing_id == entity_id:
+            continue
+        if existing.classification != classification:
+            continue
+        time_diff = abs((timestamp - existing.timestamp).total_seconds())
+        if time_diff > time_window_sec:
+            continue
+        spatial_score = 1.0 - (distance_m / distance_threshold_m)
+        temporal_score = 1.0 - (time_diff / time_window_sec)
+        combined_score = (spatial_score * 0.7) + (temporal_score * 0.3)
+        matches.append(
+            {
+                "entity_id": existing_id,
+                "entity_type": existing.entity_type,
+                "classification": existing.classification,
+                "distance_m": round(distance_m, 2),
+                "time_diff_sec": round(time_diff, 1),
+                "score": round(combined_score, 3),
+                "existing_sensors": existing.source_sensors,
+            }
+        )
+    matches.sort(key=lambda m: m["score"], reverse=True)
+    return matches
+
+
+def find_duplicates_entity(
     cop_state: COPState,
-    entity_data: dict[str, Any],
+    entity: EntityCOP,
     distance_threshold_m: float = DEFAULT_DISTANCE_THRESHOLD_M,
     time_window_sec: float = DEFAULT_TIME_WINDOW_SEC,
 ) -> dict[str, Any]:
-    """Find potential duplicate entities in the COP."""
+    """Find potential duplicates of an already-validated entity (no payload parsing)."""
     with traced_operation(
         tracer, "find_duplicates", {"distance_threshold_m": distance_threshold_m}
     ) as span:
-        try:
-            entity = EntityCOP(**entity_data)
-        except Exception as e:
-            return {"error": f"Invalid entity data: {e!s}", "matches": []}
-
-        matches: list[dict[str, Any]] = []
-        for existing_id, existing in cop_state.entities.items():
-            if existing_id == entity.entity_id:
-                continue
-            if existing.entity_type != entity.entity_type:
-                continue
-            if existing.classification != entity.classification:
-                continue
-            distance_m = haversine_distance(entity.location, existing.location)
-            if distance_m > distance_threshold_m:
-                continue
-            time_diff = abs((entity.timestamp - existing.timestamp).total_seconds())
-            if time_diff > time_window_sec:
-                continue
-            spatial_score = 1.0 - (distance_m / distance_threshold_m)
-            temporal_score = 1.0 - (time_diff / time_window_sec)
-            combined_score = (spatial_score * 0.7) + (temporal_score * 0.3)
-            matches.append(
-                {
-                    "entity_id": existing_id,
-                    "entity_type": existing.entity_type,
-                    "classification": existing.classification,
-                    "distance_m": round(distance_m, 2),
-                    "time_diff_sec": round(time_diff, 1),
-                    "score": round(combined_score, 3),
-                    "existing_sensors": existing.source_sensors,
-                }
-            )
-        matches.sort(key=lambda m: m["score"], reverse=True)
+        matches = _find_duplicates_core(
+            cop_state,
+            entity.entity_id,
+            entity.entity_type,
+            entity.classification,
+            entity.location.lat,
+            entity.location.lon,
+            entity.timestamp,
+            distance_threshold_m,
+            time_window_sec,
+        )
         span.set_attribute("cop.matches_found", len(matches))
         return {
             "matches": matches,
@@ -80,6 +170,22 @@ def find_duplicates(
         }
 
 
+def find_duplicates(
+    cop_state: COPState,
+    entity_data: dict[str, Any] | str | bytes,
+    distance_threshold_m: float = DEFAULT_DISTANCE_THRESHOLD_M,
+    time_window_sec: float = DEFAULT_TIME_WINDOW_SEC,
+) -> dict[str, Any]:
+    """Find potential duplicate entities in the COP from a dict or JSON payload."""
+    try:
+        if isinstance(entity_data, str | bytes):
+            entity_data = _json_loads(entity_data)
+        entity = EntityCOP.model_validate(entity_data)
+    except Exception as e:
+        return {"error": f"Invalid entity data: {e!s}", "matches": []}
+    return find_duplicates_entity(cop_state, entity, distance_threshold_m, time_window_sec)
+
+
 def merge_entities(
     cop_state: COPState, entity1_id: str, entity2_id: str, keep_id: str | None = None
 ) -> dict[str, Any]:
@@ -157,23 +263,42 @@ def merge_entities(
         }
 
 
-def update_cop(cop_state: COPState, entities_data: list[dict[str, Any]]) -> dict[str, Any]:
-    """Add or update entities in the COP."""
+def _parse_entity(entity_data: dict[str, Any]) -> EntityCOP | dict[str, str]:
+    """Validate one entity payload, returning the entity or an error record."""
+    try:
+        return EntityCOP(**entity_data)
+    except Exception as e:
+        return {"entity_id": entity_data.get("entity_id", "unknown"), "error": str(e)}
+
+
+def update_cop(
+    cop_state: COPState, entities_data: list[dict[str, Any]] | str | bytes
+) -> dict[str, Any]:
+    """Add or update entities in the COP. Accepts a list of dicts or its raw JSON."""
+    if isinstance(entities_data, str | bytes):
+        try:
+            entities_data = _json_loads(entities_data)
+        except ValueError as e:
+            return {"error": f"Invalid entities JSON: {e!s}"}
+        if not isinstance(entities_data, list):
+            return {"error": "Entities JSON must be a list of entity objects"}
     with traced_operation(tracer, "update_cop", {"entities_count": len(entities_data)}) as span:
-        added, updated = 0, 0
+        # Parse the batch at once; if any item is invalid, parse per item to report it
         errors: list[dict[str, str]] = []
-        for entity_data in entities_data:
-            try:
-                entity = EntityCOP(**entity_data)
-                action = cop_state.upsert_entity(entity)
-                if action == "added":
-                    added += 1
+        try:
+            entities = _ENTITY_LIST_ADAPTER.validate_python(entities_data)
+        except ValidationError:
+            entities = []
+            for parsed in map(_parse_entity, entities_data):
+                if isinstance(parsed, EntityCOP):
+                    entities.append(parsed)
                 else:
-                    updated += 1
-            except Exception as e:
-                errors.append(
-                    {"entity_id": entity_data.get("entity_id", "unknown"), "error": str(e)}
-                )
+                    errors.append(parsed)
+
+        # Commit all valid entities under a single lock
+        actions = cop_state.upsert_entities(entities)
+        added = actions.count("added")
+        updated = len(actions) - added
         span.set_attribute("cop.added", added)
         span.set_attribute("cop.updated", updated)
         return {
@@ -196,12 +321,11 @@ def query_cop(
 ) -> dict[str, Any]:
     """Query entities from the COP with filters."""
     with traced_operation(tracer, "query_cop") as span:
-        entities = list(cop_state.entities.values())
         results: list[EntityCOP] = []
         ts_filter: datetime | None = None
         if since_timestamp:
             try:
-                ts_filter = datetime.fromisoformat(since_timestamp.replace("Z", "+00:00"))
+                ts_filter = parse_iso_timestamp(since_timestamp)
             except ValueError:
                 return {"error": f"Invalid timestamp format: {since_timestamp}"}
         bbox_filter: tuple[float, float, float, float] | None = None
@@ -210,31 +334,34 @@ def query_cop(
                 return {"error": "bbox must have 4 values: [min_lat, min_lon, max_lat, max_lon]"}
             bbox_filter = (bbox[0], bbox[1], bbox[2], bbox[3])
 
-        for entity in entities:
-            if entity_type and entity.entity_type != entity_type:
-                continue
-            if classification and entity.classification != classification.lower():
-                continue
-            if min_confidence and entity.confidence < min_confidence:
-                continue
-            if ts_filter and entity.timestamp < ts_filter:
-                continue
+        # Column filters combine into one mask; timestamps are checked per selected row
+        with cop_state.entity_columns() as columns:
+            total_in_cop = len(columns)
+            mask = columns.alive.copy()
+            if entity_type:
+                mask &= columns.entity_types == entity_type
+            if classification:
+                mask &= columns.classifications == classification.lower()
+            if min_confidence:
+                mask &= columns.confidences >= min_confidence
             if bbox_filter:
                 min_lat, min_lon, max_lat, max_lon = bbox_filter
-                if not (
-                    min_lat <= entity.location.lat <= max_lat
-                    and min_lon <= entity.location.lon <= max_lon
-                ):
+                mask &= (min_lat <= columns.lats) & (columns.lats <= max_lat)
+                mask &= (min_lon <= columns.lons) & (columns.lons <= max_lon)
+
+            for i in np.flatnonzero(mask).tolist():
+                entity = columns.entities[i]
+                if ts_filter and entity.timestamp < ts_filter:
                     continue
-            results.append(entity)
-            if len(results) >= limit:
-                break
+                results.append(entity)
+                if len(results) >= limit:
+                    break
 
         span.set_attribute("cop.results_count", len(results))
         return {
             "entities": [e.model_dump_json_safe() for e in results],
             "count": len(results),
-            "total_in_cop": len(entities),
+            "total_in_cop": total_in_cop,
             "filters_applied": {
                 "entity_type": entity_type,
                 "classification": classification,
@@ -13,8 +13,15 @@ from src.mcp_servers.multimodal.document_tools import (
     get_document_info,
     is_document_file,
     process_document,
+    process_documents,
     validate_document_file,
 )
+from src.mcp_servers.multimodal.file_types import (
+    FileKind,
+    FileRef,
+    classify_file,
+    file_ref,
+)
 from src.mcp_servers.multimodal.image_tools import (
     analyze_image,
     is_image_file,
@@ -34,7 +41,12 @@ __all__ = [
     "is_image_file",
     "validate_image_file",
     "process_document",
+    "process_documents",
     "get_document_info",
     "is_document_file",
     "validate_document_file",
+    "FileKind",
+    "FileRef",
+    "classify_file",
+    "file_ref",
 ]
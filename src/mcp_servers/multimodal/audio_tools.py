@@ -10,12 +10,16 @@ from pathlib import Path
 from typing import Any
 
 from src.core.telemetry import get_tracer, traced_operation
+from src.mcp_servers.multimodal.file_types import (
+    FileKind,
+    FileRef,
+    classify_file,
+    file_ref,
+)
 
 logger = logging.getLogger(__name__)
 tracer = get_tracer("copforge.mcp.multimodal.audio")
 
-SUPPORTED_AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".aac", ".wma"}
-
 # Lazy-loaded models
 _whisper_model: Any = None
 _diarization_pipeline: Any = None
@@ -62,18 +66,21 @@ def _load_diarization_pipeline() -> Any:
     return _diarization_pipeline
 
 
-def is_audio_file(file_path: str) -> bool:
+def is_audio_file(file_path: str | FileRef) -> bool:
     """Check if file is a supported audio format."""
-    return Path(file_path).suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS
+    return classify_file(file_path) is FileKind.AUDIO
 
 
-def validate_audio_file(audio_path: str) -> tuple[bool, str | None]:
+def validate_audio_file(audio_path: str | FileRef) -> tuple[bool, str | None]:
     """Validate audio file exists and is supported."""
-    if not os.path.exists(audio_path):
-        return False, f"Audio file not found: {audio_path}"
-    if not is_audio_file(audio_path):
-        return False, f"Unsupported audio format: {Path(audio_path).suffix}"
-    file_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
+    ref = file_ref(audio_path)
+    try:
+        file_size = os.stat(ref.path).st_size
+    except (OSError, ValueError):
+        return False, f"Audio file not found: {ref.path}"
+    if not is_audio_file(ref):
+        return False, f"Unsupported audio format: {Path(ref.path).suffix}"
+    file_size_mb = file_size / (1024 * 1024)
     if file_size_mb > 100:
         return False, f"Audio file too large: {file_size_mb:.1f}MB (max 100MB)"
     return True, None
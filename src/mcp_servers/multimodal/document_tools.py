@@ -2,35 +2,59 @@
 Document Processing Tools - PDF, TXT, DOCX extraction.
 """
 
+import codecs
 import logging
+import mmap
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from src.core.telemetry import get_tracer, traced_operation
+from src.mcp_servers.multimodal.file_types import (
+    SUPPORTED_DOCUMENT_EXTENSIONS,
+    FileKind,
+    FileRef,
+    classify_file,
+    file_ref,
+)
 
 logger = logging.getLogger(__name__)
 tracer = get_tracer("copforge.mcp.multimodal.document")
 
-SUPPORTED_DOCUMENT_EXTENSIONS = {".txt", ".pdf", ".docx"}
+# Whitespace runs other than newlines, and the same around a newline
+_INLINE_SPACE_RE = re.compile(r"[^\S\n]+")
+_LINE_EDGE_SPACE_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
+# Most bytes of a TXT file that are decoded; matches the 50MB validation limit
+MAX_TEXT_BYTES = 50 * 1024 * 1024
 
-def is_document_file(file_path: str) -> bool:
+
+def is_document_file(file_path: str | FileRef) -> bool:
     """Check if file is a supported document format."""
-    return Path(file_path).suffix.lower() in SUPPORTED_DOCUMENT_EXTENSIONS
+    return classify_file(file_path) is FileKind.DOCUMENT
 
 
-def validate_document_file(document_path: str) -> tuple[bool, str | None]:
+def validate_document_file(document_path: str | FileRef) -> tuple[bool, str | None]:
     """Validate document file exists and is supported."""
-    if not os.path.exists(document_path):
-        return False, f"Document file not found: {document_path}"
-    extension = Path(document_path).suffix.lower()
+    ref = file_ref(document_path)
+    try:
+        file_size = os.stat(ref.path).st_size
+    except (OSError, ValueError):
+        return False, f"Document file not found: {ref.path}"
+    extension = ref.ext
     if extension not in SUPPORTED_DOCUMENT_EXTENSIONS:
-        return False, f"Unsupported format: {extension}. Supported: {SUPPORTED_DOCUMENT_EXTENSIONS}"
+        return (
+            False,
+            f"Unsupported format: {extension}. Supported: {sorted(SUPPORTED_DOCUMENT_EXTENSIONS)}",
+        )
     if extension == ".doc":
         return False, "Legacy .doc format not supported. Convert to .docx or .pdf"
-    file_size_mb = os.path.getsize(document_path) / (1024 * 1024)
+    file_size_mb = file_size / (1024 * 1024)
     if file_size_mb > 50:
         return False, f"Document too large: {file_size_mb:.1f}MB (max 50MB)"
     return True, None
@@ -57,14 +81,42 @@ def _extract_text_from_pdf(pdf_path: str) -> str | None:
 
 
 def _read_text_file(text_path: str) -> str | None:
-    """Read plain text file with fallback encodings."""
-    encodings = ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
-    for enc in encodings:
-        try:
-            with open(text_path, encoding=enc) as file:
-                return file.read()
-        except (UnicodeDecodeError, LookupError):
-            continue
+    """
+    Read plain text file with fallback encodings.
+
+    The file is memory-mapped and each encoding decodes straight from a
+    view of at most MAX_TEXT_BYTES bytes, so no intermediate bytes copy is
+    made; empty files return "" without mapping. A longer file is truncated
+    (and logged); a UTF-8 character split by the cut is dropped rather than
+    failing the UTF-8 attempt. process_document never reaches the cap, since
+    validate_document_file already rejects files over 50MB; the cap
+    only bounds direct callers. Newlines are translated as in text mode.
+    """
+    with open(text_path, "rb") as file:
+        file_size = os.fstat(file.fileno()).st_size
+        if file_size == 0:
+            return ""
+        truncated = file_size > MAX_TEXT_BYTES
+        if truncated:
+            logger.warning(
+                f"Truncating {Path(text_path).name} to {MAX_TEXT_BYTES} of {file_size} bytes"
+            )
+        with (
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as whole,
+            whole[:MAX_TEXT_BYTES] as data,
+        ):
+            encodings = ["utf-8", "latin-1", "cp1252", "iso-8859-1"]
+            for enc in encodings:
+                try:
+                    if enc == "utf-8":
+                        # final=False leaves an incomplete trailing sequence undecoded
+                        text, _ = codecs.utf_8_decode(data, "strict", not truncated)
+                    else:
+                        text = codecs.decode(data, enc)
+                except (UnicodeDecodeError, LookupError):
+                    continue
+                return text.replace("\r\n", "\n").replace("\r", "\n")
     logger.error(f"Failed to read {text_path} with any encoding")
     return None
 
@@ -97,27 +149,33 @@ def _extract_text_from_docx(docx_path: str) -> str | None:
 
 
 def clean_extracted_text(text: str, max_lines: int | None = None) -> str:
-    """Clean and preprocess extracted text."""
+    """
+    Clean and preprocess extracted text.
+
+    Strips each line, collapses whitespace runs inside a line to one space
+    and collapses runs of blank lines to a single blank line (dropping
+    leading ones). Done with whole-text regex passes instead of a per-line
+    loop; the output is the same.
+    """
     if not text:
         return ""
 
-    lines = text.split("\n")
-    cleaned_lines: list[str] = []
+    cleaned = _INLINE_SPACE_RE.sub(" ", text)
+    cleaned = _LINE_EDGE_SPACE_RE.sub("\n", cleaned).strip(" ")
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            if cleaned_lines and cleaned_lines[-1] != "":
-                cleaned_lines.append("")
-            continue
-        line = " ".join(line.split())
-        cleaned_lines.append(line)
+    # Blank-line runs: dropped at the start, kept as one blank line inside,
+    # and a trailing run leaves a single empty last line
+    cleaned = cleaned.lstrip("\n")
+    body = cleaned.rstrip("\n")
+    cleaned = _BLANK_LINES_RE.sub("\n\n", body) + ("\n" if len(body) < len(cleaned) else "")
 
-    if max_lines and len(cleaned_lines) > max_lines:
-        cleaned_lines = cleaned_lines[:max_lines]
-        cleaned_lines.append(f"\n... [Truncated - total {len(lines)} lines] ...")
+    if max_lines and cleaned and cleaned.count("\n") >= max_lines:
+        total_lines = text.count("\n") + 1
+        kept = cleaned.split("\n", max_lines)[:max_lines]
+        kept.append(f"\n... [Truncated - total {total_lines} lines] ...")
+        return "\n".join(kept)
 
-    return "\n".join(cleaned_lines)
+    return cleaned
 
 
 def extract_text_from_document(
@@ -140,7 +198,8 @@ def extract_text_from_document(
         tracer, "extract_text_from_document", {"document_path": document_path}
     ) as span:
         try:
-            is_valid, error = validate_document_file(document_path)
+            ref = file_ref(document_path)
+            is_valid, error = validate_document_file(ref)
             if not is_valid:
                 return {
                     "success": False,
@@ -151,7 +210,7 @@ def extract_text_from_document(
                     "error": error,
                 }
 
-            extension = Path(document_path).suffix.lower()
+            extension = ref.ext
             logger.info(f"Extracting text from: {Path(document_path).name}")
 
             if extension == ".pdf":
@@ -258,6 +317,36 @@ def process_document(document_path: str, max_lines: int | None = 1000) -> dict[s
         }
 
 
+def process_documents(
+    document_paths: list[str], max_lines: int | None = 1000, max_workers: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Process several documents, e.g. every file of a directory, in a thread pool.
+
+    Threads overlap file I/O and any extraction that releases the GIL. PDFs
+    are read with PyPDF2, which is pure Python, so PDF-heavy batches gain
+    less than TXT/DOCX ones. A single document (or max_workers=1) is
+    processed inline.
+
+    Args:
+        document_paths: Paths to document files
+        max_lines: Maximum lines to extract per document
+        max_workers: Worker thread count (defaults to ThreadPoolExecutor's)
+
+    Returns:
+        One process_document result per path, in input order
+    """
+    with traced_operation(tracer, "process_documents") as span:
+        span.set_attribute("document.count", len(document_paths))
+        process = partial(process_document, max_lines=max_lines)
+
+        if len(document_paths) <= 1 or max_workers == 1:
+            return [process(path) for path in document_paths]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(process, document_paths))
+
+
 def get_document_info(document_path: str) -> dict[str, Any] | None:
     """Get basic document metadata without extracting content."""
     try:
@@ -0,0 +1,73 @@
+"""
+File Type Classification - Shared extension lookup for the multimodal tools.
+"""
+
+import os
+from enum import IntEnum
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class FileKind(IntEnum):
+    """Kind of input file, decided by its final extension."""
+
+    UNSUPPORTED = 0
+    AUDIO = 1
+    IMAGE = 2
+    DOCUMENT = 3
+
+
+SUPPORTED_AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".m4a", ".flac", ".ogg", ".aac", ".wma"})
+SUPPORTED_IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff", ".tif"}
+)
+SUPPORTED_DOCUMENT_EXTENSIONS = frozenset({".txt", ".pdf", ".docx"})
+
+# One lookup table keyed by lowercase extension
+_KIND_BY_EXTENSION: dict[str, FileKind] = {
+    **dict.fromkeys(SUPPORTED_AUDIO_EXTENSIONS, FileKind.AUDIO),
+    **dict.fromkeys(SUPPORTED_IMAGE_EXTENSIONS, FileKind.IMAGE),
+    **dict.fromkeys(SUPPORTED_DOCUMENT_EXTENSIONS, FileKind.DOCUMENT),
+}
+
+
+def file_extension(file_path: str) -> str:
+    """Return the final extension of file_path, lowercased (e.g. ".wav")."""
+    return os.path.splitext(file_path)[1].lower()
+
+
+class FileRef(NamedTuple):
+    """A file path together with its lowercased final extension."""
+
+    path: str
+    ext: str
+
+
+def file_ref(file_path: str | FileRef) -> FileRef:
+    """
+    Canonicalize a path once so later checks reuse its lowercased extension.
+
+    The multimodal tools accept either a plain path or a FileRef; build the
+    FileRef once per request and pass it to every check on the same file.
+    An existing FileRef is returned unchanged.
+    """
+    if isinstance(file_path, FileRef):
+        return file_path
+    return FileRef(file_path, file_extension(file_path))
+
+
+@lru_cache(maxsize=4096)
+def classify_file(file_path: str | FileRef) -> FileKind:
+    """
+    Classify a file by its final extension, case-insensitively.
+
+    Results are cached per path, so the is_*_file predicates share one
+    lookup when several of them are asked about the same file.
+
+    Args:
+        file_path: Path, file name or FileRef to classify.
+
+    Returns:
+        The FileKind, or FileKind.UNSUPPORTED for unknown extensions.
+    """
+    return _KIND_BY_EXTENSION.get(file_ref(file_path).ext, FileKind.UNSUPPORTED)
@@ -5,16 +5,22 @@ Image Analysis Tools - VLM-based image analysis.
 import base64
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
 from src.core.telemetry import get_tracer, traced_operation
+from src.mcp_servers.multimodal.file_types import (
+    SUPPORTED_IMAGE_EXTENSIONS,
+    FileKind,
+    FileRef,
+    classify_file,
+    file_ref,
+)
 
 logger = logging.getLogger(__name__)
 tracer = get_tracer("copforge.mcp.multimodal.image")
 
-SUPPORTED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff", ".tif"}
-
 MIME_TYPES = {
     ".jpg": "image/jpeg",
     ".jpeg": "image/jpeg",
@@ -66,19 +72,22 @@ If NO military assets detected, explicitly state that.""",
 AnalysisType = Literal["general", "asset_detection", "terrain", "damage", "custom"]
 
 
-def is_image_file(file_path: str) -> bool:
+def is_image_file(file_path: str | FileRef) -> bool:
     """Check if file is a supported image format."""
-    return Path(file_path).suffix.lower() in SUPPORTED_IMAGE_EXTENSIONS
+    return classify_file(file_path) is FileKind.IMAGE
 
 
-def validate_image_file(image_path: str) -> tuple[bool, str | None]:
+def validate_image_file(image_path: str | FileRef) -> tuple[bool, str | None]:
     """Validate image file exists and is supported."""
-    if not os.path.exists(image_path):
-        return False, f"Image file not found: {image_path}"
-    extension = Path(image_path).suffix.lower()
+    ref = file_ref(image_path)
+    try:
+        file_size = os.stat(ref.path).st_size
+    except (OSError, ValueError):
+        return False, f"Image file not found: {ref.path}"
+    extension = ref.ext
     if extension not in SUPPORTED_IMAGE_EXTENSIONS:
         return False, f"Unsupported image format: {extension}"
-    file_size_mb = os.path.getsize(image_path) / (1024 * 1024)
+    file_size_mb = file_size / (1024 * 1024)
     if file_size_mb > 20:
         return False, f"Image too large: {file_size_mb:.1f}MB (max 20MB)"
     return True, None
@@ -94,10 +103,10 @@ def encode_image_to_base64(image_path: str) -> str | None:
         return None
 
 
-def get_image_mime_type(image_path: str) -> str:
-    """Get MIME type from image file extension."""
-    extension = Path(image_path).suffix.lower()
-    return MIME_TYPES.get(extension, "image/jpeg")
+@lru_cache(maxsize=1024)
+def get_image_mime_type(image_path: str | FileRef) -> str:
+    """Get MIME type from image file extension (memoized per path)."""
+    return MIME_TYPES.get(file_ref(image_path).ext, "image/jpeg")
 
 
 def analyze_image_with_vlm(
@@ -122,7 +131,8 @@ def analyze_image_with_vlm(
     """
     with traced_operation(tracer, "analyze_image_with_vlm", {"model": model}) as span:
         try:
-            is_valid, error = validate_image_file(image_path)
+            ref = file_ref(image_path)
+            is_valid, error = validate_image_file(ref)
             if not is_valid:
                 return {"success": False, "analysis": "", "model_used": model, "error": error}
 
@@ -135,7 +145,7 @@ def analyze_image_with_vlm(
                     "error": "Failed to encode image",
                 }
 
-            mime_type = get_image_mime_type(image_path)
+            mime_type = get_image_mime_type(ref)
 
             # Use LangChain for provider abstraction
             from langchain_core.messages import HumanMessage
@@ -2,7 +2,7 @@
 CopForge data models.
 
 This package contains all Pydantic models for the CopForge system:
-- COP models: EntityCOP, Location, ThreatAssessment, COPSnapshot
+- COP models: EntityCOP, EntityBatch, Location, ThreatAssessment, COPSnapshot
 - Sensor models: SensorMessage, and format-specific models (ASTERIX, Drone, etc.)
 """
 
@@ -11,6 +11,7 @@ from src.models.cop import (
     AccessLevel,
     ClassificationType,
     COPSnapshot,
+    EntityBatch,
     EntityCOP,
     EntityType,
     InfoClassificationLevel,
@@ -32,11 +33,14 @@ from src.models.sensor import (
     SensorMessageBatch,
     SensorType,
     TrackQuality,
+    decode_sensor_message,
+    decode_sensor_messages,
 )
 
 __all__ = [
     # COP models
     "EntityCOP",
+    "EntityBatch",
     "Location",
     "ThreatAssessment",
     "COPSnapshot",
@@ -58,4 +62,7 @@ __all__ = [
     # Sensor types
     "SensorType",
     "FileType",
+    # Sensor JSON decoding
+    "decode_sensor_message",
+    "decode_sensor_messages",
 ]
@@ -5,10 +5,15 @@ These models represent normalized entities in the operational picture,
 regardless of their original sensor source.
 """
 
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Literal
+from functools import lru_cache
+from typing import Any, Literal, get_args
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 
 # =============================================================================
 # Type Definitions
@@ -66,6 +71,42 @@ AccessLevel = Literal[
 ]
 
 
+# =============================================================================
+# Parsing Helpers
+# =============================================================================
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC.
+
+    Cached because sensors in the same tick emit identical timestamp strings;
+    datetimes are immutable so sharing them is safe.
+
+    Raises:
+        ValueError: If value is not a valid ISO-8601 timestamp.
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+_DATETIME_ADAPTER: TypeAdapter[datetime] = TypeAdapter(datetime)
+
+
+@lru_cache(maxsize=4096)
+def _validate_timestamp_str(value: str) -> datetime:
+    """
+    Parse a timestamp string exactly as a pydantic datetime field would.
+
+    Cached like parse_iso_timestamp, but keeps pydantic's (RFC 3339)
+    grammar so model validation accepts no extra formats.
+
+    Raises:
+        ValidationError: If pydantic rejects value.
+    """
+    return _DATETIME_ADAPTER.validate_python(value)
+
+
 # =============================================================================
 # Core Models
 # =============================================================================
@@ -153,19 +194,36 @@ class EntityCOP(BaseModel):
     @field_validator("classification", mode="before")
     @classmethod
     def normalize_classification(cls, v: str) -> str:
-        """Normalize classification to lowercase."""
+        """Normalize classification to lowercase (interned for fast lookups)."""
         if isinstance(v, str):
-            return v.lower()
+            return sys.intern(v.lower())
         return v
 
     @field_validator("information_classification", mode="before")
     @classmethod
     def normalize_info_classification(cls, v: str) -> str:
-        """Normalize information classification to uppercase."""
+        """Normalize information classification to uppercase (interned for fast lookups)."""
         if isinstance(v, str):
-            return v.upper()
+            return sys.intern(v.upper())
         return v
 
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def parse_timestamp(cls, v: Any) -> Any:
+        """Parse timestamp strings through a cache; anything else is left to pydantic."""
+        if isinstance(v, str):
+            try:
+                return _validate_timestamp_str(v)
+            except ValidationError:
+                return v
+        return v
+
+    @field_validator("source_sensors", mode="after")
+    @classmethod
+    def intern_source_sensors(cls, v: list[str]) -> list[str]:
+        """Intern sensor IDs so repeated sensors share one string object."""
+        return [sys.intern(s) for s in v]
+
     def model_dump_json_safe(self) -> dict[str, Any]:
         """Return a JSON-serializable dict (handles datetime)."""
         data = self.model_dump()
@@ -269,3 +327,47 @@ class COPSnapshot(BaseModel):
     metadata: dict[str, Any] = Field(
         default_factory=dict, description="Additional snapshot metadata"
     )
+
+
+# =============================================================================
+# Batch Views
+# =============================================================================
+
+# Information classification level -> int8 code, in increasing restriction
+CLASSIFICATION_CODES: dict[str, int] = {
+    level: code for code, level in enumerate(get_args(InfoClassificationLevel))
+}
+
+
+@dataclass(frozen=True, slots=True)
+class EntityBatch:
+    """
+    Column view of a set of entities for dissemination checks.
+
+    Holds entity IDs alongside their information classification as int8
+    codes (see CLASSIFICATION_CODES), so classification filters run as one
+    NumPy comparison instead of an attribute lookup per entity.
+    """
+
+    ids: list[str]
+    classification_codes: np.ndarray
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[EntityCOP]) -> "EntityBatch":
+        """Build a batch from EntityCOP objects, preserving their order."""
+        codes = CLASSIFICATION_CODES
+        ids: list[str] = []
+        levels: list[int] = []
+        for entity in entities:
+            ids.append(entity.entity_id)
+            levels.append(codes[entity.information_classification])
+        return cls(ids=ids, classification_codes=np.array(levels, dtype=np.int8))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def ids_above(self, level: str) -> list[str]:
+        """IDs of entities classified strictly above level, in batch order."""
+        above = np.flatnonzero(self.classification_codes > CLASSIFICATION_CODES[level])
+        ids = self.ids
+        return [ids[index] for index in above]
@@ -7,10 +7,11 @@ before normalization into EntityCOP format.
 Based on TIFDA's sensor_formats.py with improvements for modularity.
 """
 
+import sys
 from datetime import UTC, datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 # =============================================================================
 # Type Definitions
@@ -77,11 +78,23 @@ class SensorMessage(BaseModel):
     @field_validator("sensor_type", mode="before")
     @classmethod
     def normalize_sensor_type(cls, v: str) -> str:
-        """Normalize sensor type to lowercase."""
+        """Normalize sensor type to lowercase (interned for fast lookups)."""
         if isinstance(v, str):
-            return v.lower()
+            return sys.intern(v.lower())
         return v
 
+    @field_validator("sensor_id", mode="after")
+    @classmethod
+    def intern_sensor_id(cls, v: str) -> str:
+        """
+        Intern the sensor ID so repeated sensors share one string object.
+
+        Whitelist lookups keyed by sensor_id then match on identity first;
+        intern the whitelist keys too when loading them (build_sensor_auth_index
+        does this).
+        """
+        return sys.intern(v)
+
     def has_file_references(self) -> bool:
         """Check if message has file references requiring multimodal processing."""
         if self.file_references:
@@ -197,6 +210,37 @@ class SensorMessageBatch(BaseModel):
         return iter(self.messages)
 
 
+# =============================================================================
+# JSON Decoding
+# =============================================================================
+
+_SENSOR_MESSAGE_LIST_ADAPTER = TypeAdapter(list[SensorMessage])
+
+
+def decode_sensor_message(raw: str | bytes) -> SensorMessage:
+    """
+    Decode a JSON sensor message straight into a validated SensorMessage.
+
+    Parsing and validation run together in pydantic-core, skipping the
+    intermediate dict that json.loads followed by SensorMessage(**data)
+    would build.
+
+    Raises:
+        pydantic.ValidationError: If raw is not valid JSON or not a valid message.
+    """
+    return SensorMessage.model_validate_json(raw)
+
+
+def decode_sensor_messages(raw: str | bytes) -> list[SensorMessage]:
+    """
+    Decode a JSON array of sensor messages in a single call.
+
+    Raises:
+        pydantic.ValidationError: If raw is not a valid JSON array of messages.
+    """
+    return _SENSOR_MESSAGE_LIST_ADAPTER.validate_json(raw)
+
+
 # =============================================================================
 # Sensor-Specific Data Models (for validation and documentation)
 # =============================================================================
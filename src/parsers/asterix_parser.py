@@ -7,6 +7,7 @@ ASTERIX is the standard for radar data exchange in European airspace.
 
 from typing import Any
 
+from src.core.constants import CLASSIFICATIONS
 from src.core.telemetry import get_tracer, traced_operation
 from src.models.cop import EntityCOP, Location
 from src.models.sensor import SensorMessage
@@ -47,10 +48,12 @@ class ASTERIXParser(BaseParser):
         }
     """
 
+    SENSOR_TYPES = frozenset({"radar"})
+
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is ASTERIX format."""
         # Check sensor type
-        if sensor_msg.sensor_type != "radar":
+        if not super().can_parse(sensor_msg):
             return False
 
         # Check for ASTERIX format indicator
@@ -103,7 +106,6 @@ class ASTERIXParser(BaseParser):
             },
         ) as span:
             data: dict[str, Any] = sensor_msg.data  # type: ignore
-            entities: list[EntityCOP] = []
 
             # Get system-level metadata
             system_id = data.get("system_id", sensor_msg.sensor_id)
@@ -113,15 +115,12 @@ class ASTERIXParser(BaseParser):
             # Radar data is typically SECRET or CONFIDENTIAL
             base_classification = data.get("classification_level", "SECRET")
 
-            for track in data["tracks"]:
-                entity = self._parse_track(
-                    track=track,
-                    sensor_msg=sensor_msg,
-                    system_id=system_id,
-                    is_simulated=is_simulated,
-                    base_classification=base_classification,
-                )
-                entities.append(entity)
+            # Bound method hoisted out of the per-track loop
+            parse_track = self._parse_track
+            entities = [
+                parse_track(track, sensor_msg, system_id, is_simulated, base_classification)
+                for track in data["tracks"]
+            ]
 
             span.set_attribute("entities_created", len(entities))
             return entities
@@ -135,8 +134,13 @@ class ASTERIXParser(BaseParser):
         base_classification: str,
     ) -> EntityCOP:
         """Parse a single ASTERIX track into EntityCOP."""
-        # Build entity ID
+        # Read each track field once
         track_id = track["track_id"]
+        altitude_m = track.get("altitude_m")
+        speed_kmh = track["speed_kmh"]
+        heading = track.get("heading")
+
+        # Build entity ID
         entity_id = f"{sensor_msg.sensor_id}_{track_id}"
 
         # Parse location
@@ -144,18 +148,18 @@ class ASTERIXParser(BaseParser):
         location = Location(
             lat=loc_data["lat"],
             lon=loc_data["lon"],
-            alt=track.get("altitude_m"),
+            alt=altitude_m,
         )
 
         # Determine entity type (radar detects air targets)
         entity_type = "aircraft"  # Default for radar
-        altitude = track.get("altitude_m", 0)
+        altitude = altitude_m if "altitude_m" in track else 0
         if altitude is not None and altitude < 100:
             entity_type = "ground_vehicle"  # Low altitude might be ground
 
         # Parse IFF classification
         iff_classification = track.get("classification", "unknown")
-        if iff_classification not in ["friendly", "hostile", "neutral", "unknown"]:
+        if not isinstance(iff_classification, str) or iff_classification not in CLASSIFICATIONS:
             iff_classification = "unknown"
 
         # Build metadata
@@ -163,9 +167,9 @@ class ASTERIXParser(BaseParser):
             "track_id": track_id,
             "system_id": system_id,
             "is_simulated": is_simulated,
-            "altitude_m": track.get("altitude_m"),
-            "speed_kmh": track["speed_kmh"],
-            "heading": track.get("heading"),
+            "altitude_m": altitude_m,
+            "speed_kmh": speed_kmh,
+            "heading": heading,
             "sensor_type": "radar",
         }
 
@@ -200,7 +204,7 @@ class ASTERIXParser(BaseParser):
             information_classification=info_classification,
             confidence=confidence,
             metadata=metadata,
-            speed_kmh=track["speed_kmh"],
-            heading=track.get("heading"),
+            speed_kmh=speed_kmh,
+            heading=heading,
             comments=f"Radar track {track_id} from {system_id}",
         )
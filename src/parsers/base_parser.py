@@ -8,7 +8,7 @@ into standardized EntityCOP objects for the Common Operational Picture.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from src.models.cop import EntityCOP, Location
 from src.models.sensor import SensorMessage
@@ -21,30 +21,40 @@ class BaseParser(ABC):
     Each parser is responsible for converting sensor-specific data formats
     into standardized EntityCOP objects for the Common Operational Picture.
 
-    Subclasses must implement:
-        - can_parse(): Check if parser handles this message type
+    Subclasses set SENSOR_TYPES and must implement:
         - validate(): Validate message structure
         - parse(): Convert message to EntityCOP objects
 
+    The default can_parse() accepts any message of a listed sensor type;
+    override it (calling super() first) to also check the data format.
+    Parsers that leave SENSOR_TYPES empty but override can_parse() are
+    offered every message and decide from can_parse() alone.
+
     Example:
         >>> class MyParser(BaseParser):
-        ...     def can_parse(self, msg): ...
+        ...     SENSOR_TYPES = frozenset({"radar"})
         ...     def validate(self, msg): ...
         ...     def parse(self, msg): ...
     """
 
-    @abstractmethod
+    # Sensor types this parser handles; ParserFactory only offers it messages
+    # of these types. Left empty, the default can_parse() accepts nothing.
+    SENSOR_TYPES: ClassVar[frozenset[str]] = frozenset()
+
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """
         Determine if this parser can handle the sensor message format.
 
+        The base check is a single set lookup on the sensor type, so
+        messages of the wrong type are rejected before any data is read.
+
         Args:
             sensor_msg: Sensor message to check.
 
         Returns:
             True if parser recognizes and can handle this format.
         """
-        pass
+        return sensor_msg.sensor_type in self.SENSOR_TYPES
 
     @abstractmethod
     def parse(self, sensor_msg: SensorMessage) -> list[EntityCOP]:
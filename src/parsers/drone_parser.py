@@ -37,9 +37,11 @@ class DroneParser(BaseParser):
         }
     """
 
+    SENSOR_TYPES = frozenset({"drone"})
+
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is drone format."""
-        if sensor_msg.sensor_type != "drone":
+        if not super().can_parse(sensor_msg):
             return False
 
         data = sensor_msg.data
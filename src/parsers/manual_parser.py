@@ -42,9 +42,11 @@ class ManualParser(BaseParser):
         - OTHER: Generic report
     """
 
+    SENSOR_TYPES = frozenset({"manual"})
+
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is manual report format."""
-        if sensor_msg.sensor_type != "manual":
+        if not super().can_parse(sensor_msg):
             return False
 
         data = sensor_msg.data
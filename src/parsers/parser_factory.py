@@ -6,6 +6,7 @@ Uses the Strategy pattern to select the right parser for each message type.
 """
 
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Any
 
 from src.core.telemetry import get_tracer, traced_operation
@@ -46,12 +47,24 @@ class ParseResult:
 # =============================================================================
 
 
+def _checks_any_type(parser: BaseParser) -> bool:
+    """
+    Whether parser has no SENSOR_TYPES but its own can_parse().
+
+    Such parsers predate SENSOR_TYPES dispatch, so they are still offered
+    every message.
+    """
+    return not parser.SENSOR_TYPES and type(parser).can_parse is not BaseParser.can_parse
+
+
 class ParserFactory:
     """
     Factory for selecting and executing appropriate parser for sensor messages.
 
     Uses the Strategy pattern to select the right parser based on message type.
-    Parsers are tried in order until one accepts the message.
+    Parsers are tried in order until one accepts the message; only parsers
+    whose SENSOR_TYPES include the message's type are tried, plus custom
+    parsers that leave SENSOR_TYPES empty and implement their own can_parse().
 
     Example:
         >>> factory = ParserFactory()
@@ -63,12 +76,24 @@ class ParserFactory:
 
     def __init__(self) -> None:
         """Initialize parser factory with all available parsers."""
-        self.parsers: list[BaseParser] = [
+        self._parsers: tuple[BaseParser, ...] = (
             ASTERIXParser(),
             DroneParser(),
             RadioParser(),
             ManualParser(),
-        ]
+        )
+        # sensor_type -> matching parsers in registration order (built lazily)
+        self._by_type: dict[str, list[BaseParser]] = {}
+
+    @property
+    def parsers(self) -> tuple[BaseParser, ...]:
+        """
+        Registered parsers, in the order they are tried.
+
+        Read-only so the per-type dispatch cache cannot go stale; add
+        parsers with register_parser().
+        """
+        return self._parsers
 
     def get_parser(self, sensor_msg: SensorMessage) -> BaseParser | None:
         """
@@ -80,11 +105,24 @@ class ParserFactory:
         Returns:
             Parser instance that can handle this format, or None if no parser found.
         """
-        for parser in self.parsers:
+        candidates = self._by_type.get(sensor_msg.sensor_type)
+        if candidates is None:
+            candidates = self._parsers_for_type(sensor_msg.sensor_type)
+        for parser in candidates:
             if parser.can_parse(sensor_msg):
                 return parser
         return None
 
+    def _parsers_for_type(self, sensor_type: str) -> list[BaseParser]:
+        """Build and remember the parsers that may accept sensor_type."""
+        candidates = [
+            p
+            for p in self._parsers
+            if sensor_type in p.SENSOR_TYPES or _checks_any_type(p)
+        ]
+        self._by_type[sensor_type] = candidates
+        return candidates
+
     def parse(self, sensor_msg: SensorMessage) -> ParseResult:
         """
         Parse sensor message using appropriate parser.
@@ -162,7 +200,8 @@ class ParserFactory:
         Args:
             parser: Parser instance to register.
         """
-        self.parsers.append(parser)
+        self._parsers = (*self._parsers, parser)
+        self._by_type.clear()
 
     def list_parsers(self) -> list[str]:
         """
@@ -178,13 +217,16 @@ class ParserFactory:
 # Global Factory Instance (Singleton)
 # =============================================================================
 
-_parser_factory: ParserFactory | None = None
-
 
+@cache
 def get_parser_factory() -> ParserFactory:
     """
     Get global parser factory instance (singleton).
 
+    The instance is created on first call and memoized. It is shared and
+    mutable: parsers added with register_parser are seen by every caller,
+    so register them at startup rather than while messages are in flight.
+
     Returns:
         ParserFactory instance.
 
@@ -192,9 +234,4 @@ def get_parser_factory() -> ParserFactory:
         >>> factory = get_parser_factory()
         >>> result = factory.parse(sensor_msg)
     """
-    global _parser_factory
-
-    if _parser_factory is None:
-        _parser_factory = ParserFactory()
-
-    return _parser_factory
+    return ParserFactory()
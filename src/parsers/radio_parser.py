@@ -38,9 +38,11 @@ class RadioParser(BaseParser):
         }
     """
 
+    SENSOR_TYPES = frozenset({"radio"})
+
     def can_parse(self, sensor_msg: SensorMessage) -> bool:
         """Check if message is radio format."""
-        if sensor_msg.sensor_type != "radio":
+        if not super().can_parse(sensor_msg):
             return False
 
         data = sensor_msg.data
@@ -7,16 +7,30 @@ and outgoing transmissions.
 
 from src.security.firewall import (
     FirewallResult,
+    SensorAuthIndex,
+    build_sensor_auth_index,
     get_firewall_stats,
+    invalidate_validation_cache,
+    set_re2_enabled,
     validate_dissemination,
     validate_entity,
     validate_sensor_input,
+    validate_sensor_input_lenient,
+    validate_sensor_input_strict,
+    validate_sensor_inputs,
 )
 
 __all__ = [
     "validate_sensor_input",
+    "validate_sensor_input_strict",
+    "validate_sensor_input_lenient",
+    "validate_sensor_inputs",
     "validate_entity",
     "validate_dissemination",
     "get_firewall_stats",
+    "build_sensor_auth_index",
+    "invalidate_validation_cache",
+    "set_re2_enabled",
     "FirewallResult",
+    "SensorAuthIndex",
 ]
@@ -24,44 +24,157 @@ Usage:
         logger.error(f"Entity invalid: {result.error}")
 """
 
+import atexit
+import os
 import re
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache, partial
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Protocol
+
+import numpy as np
 
 from src.core.constants import (
     ACCESS_LEVELS,
+    ACCESS_TO_MAX_CLASSIFICATION,
+    CLASSIFICATION_HIERARCHY,
     CLASSIFICATION_LEVEL_SET,
+    CLASSIFICATION_LEVELS,
     CLASSIFICATIONS,
     SENSOR_TYPES,
-    can_access_classification,
 )
-from src.core.telemetry import get_tracer, traced_operation
-from src.models.cop import EntityCOP
+from src.core.telemetry import _NoOpSpan, get_tracer, is_tracing_enabled, traced_operation
+from src.models.cop import EntityBatch, EntityCOP
 from src.models.sensor import SensorMessage
 
 # Get tracer for this module
 tracer = get_tracer("copforge.security.firewall")
 
+# Shared context yielding a no-op span, used when tracing is not configured
+_NULL_SPAN: AbstractContextManager[Any] = nullcontext(_NoOpSpan())
+
+# Numeric types accepted for coordinates (tuple form is cheaper than int | float)
+_NUM: tuple[type, ...] = (int, float)
+
+# Coordinate pair count above which range checks are vectorized with NumPy
+VECTORIZE_MIN_COORDINATES = 32
+
+
+def _span(operation_name: str, attributes: dict[str, Any]) -> AbstractContextManager[Any]:
+    """
+    Open a traced span, or a shared no-op span when tracing is disabled.
+
+    Avoids span creation and attribute setting on the validation fast path
+    when no tracer provider is configured.
+    """
+    if not is_tracing_enabled():
+        return _NULL_SPAN
+    return traced_operation(tracer, operation_name, attributes)
+
 
 # =============================================================================
 # Result Types
 # =============================================================================
 
 
-@dataclass
+# Bit flags recording which checks passed (FirewallResult.passed_mask)
+CHECK_SENSOR_AUTHORIZATION = 1 << 0
+CHECK_MESSAGE_STRUCTURE = 1 << 1
+CHECK_PROMPT_INJECTION = 1 << 2
+CHECK_COORDINATE_VALIDATION = 1 << 3
+CHECK_CLASSIFICATION = 1 << 4
+CHECK_INFORMATION_CLASSIFICATION = 1 << 5
+CHECK_COORDINATES = 1 << 6
+CHECK_CONFIDENCE = 1 << 7
+CHECK_SPEED = 1 << 8
+CHECK_HEADING = 1 << 9
+CHECK_COMMENTS = 1 << 10
+
+# Check names in reporting order
+_CHECK_NAMES: tuple[tuple[int, str], ...] = (
+    (CHECK_SENSOR_AUTHORIZATION, "sensor_authorization"),
+    (CHECK_MESSAGE_STRUCTURE, "message_structure"),
+    (CHECK_PROMPT_INJECTION, "prompt_injection"),
+    (CHECK_COORDINATE_VALIDATION, "coordinate_validation"),
+    (CHECK_CLASSIFICATION, "classification"),
+    (CHECK_INFORMATION_CLASSIFICATION, "information_classification"),
+    (CHECK_COORDINATES, "coordinates"),
+    (CHECK_CONFIDENCE, "confidence"),
+    (CHECK_SPEED, "speed"),
+    (CHECK_HEADING, "heading"),
+    (CHECK_COMMENTS, "comments"),
+)
+
+
+def _decode_checks(mask: int) -> list[str]:
+    """Expand a CHECK_* bitmask into check names, in reporting order."""
+    return [name for bit, name in _CHECK_NAMES if mask & bit]
+
+
+@dataclass(frozen=True, slots=True)
 class FirewallResult:
-    """Result of a firewall validation check."""
+    """
+    Result of a firewall validation check.
+
+    Passing results without details are shared between callers; their
+    details is a read-only empty mapping.
+    """
 
     is_valid: bool
     error: str = ""
-    warnings: list[str] = field(default_factory=list)
-    details: dict[str, Any] = field(default_factory=dict)
+    warnings: tuple[str, ...] = ()
+    details: Mapping[str, Any] = field(default_factory=dict)
+    passed_mask: int = 0
 
     def __bool__(self) -> bool:
         """Allow using result in boolean context."""
         return self.is_valid
 
+    def passed_checks(self) -> list[str]:
+        """Return the names of the checks that passed."""
+        return _decode_checks(self.passed_mask)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle read-only details (which cannot be pickled) as None."""
+        details = None if self.details is _NO_DETAILS else self.details
+        return (
+            _restore_result,
+            (self.is_valid, self.error, self.warnings, details, self.passed_mask),
+        )
+
+
+# Details of the shared results below; read-only so no caller can change
+# what every other caller sees
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _restore_result(
+    is_valid: bool,
+    error: str,
+    warnings: tuple[str, ...],
+    details: Mapping[str, Any] | None,
+    passed_mask: int,
+) -> FirewallResult:
+    """Unpickle a FirewallResult, restoring read-only details for None."""
+    return FirewallResult(
+        is_valid, error, warnings, _NO_DETAILS if details is None else details, passed_mask
+    )
+
+# Shared result for passing validations when no details were requested
+_OK_NO_DETAILS = FirewallResult(is_valid=True, details=_NO_DETAILS)
+
+
+@lru_cache(maxsize=16)
+def _ok_result(passed_mask: int) -> FirewallResult:
+    """Return the shared detail-less passing result for a check mask."""
+    return FirewallResult(is_valid=True, details=_NO_DETAILS, passed_mask=passed_mask)
+
 
 # =============================================================================
 # Suspicious Patterns
@@ -125,6 +238,312 @@ SUSPICIOUS_KEYWORDS: list[str] = [
     "compile(",
 ]
 
+# The tables below are derived from PROMPT_INJECTION_PATTERNS and
+# SUSPICIOUS_KEYWORDS by _build_rule_tables(), at import and again on
+# invalidate_validation_cache()
+
+# (keyword, lowercased keyword) pairs, lowered once per build; a tuple keeps
+# reporting order deterministic
+_SUSPICIOUS_KEYWORDS_LC: tuple[tuple[str, str], ...]
+
+# Prefilter: one scan for "any keyword present" before the per-keyword loop
+_KEYWORD_PREFILTER_RE: re.Pattern[str]
+
+
+def _build_keyword_automaton(keywords_lc: tuple[tuple[str, str], ...]) -> Any:
+    """Build an Aho-Corasick automaton over the lowered keywords, if available."""
+    if not keywords_lc:
+        return None
+    try:
+        import ahocorasick
+    except ImportError:  # optional speedup (copforge[perf]); regex prefilter is used instead
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, (_, keyword_lower) in enumerate(keywords_lc):
+        automaton.add_word(keyword_lower, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON: Any
+
+
+def _has_suspicious_keyword(text_lower: str) -> bool:
+    """Return True if any suspicious keyword occurs in already-lowered text."""
+    if _KEYWORD_AUTOMATON is not None:
+        return next(_KEYWORD_AUTOMATON.iter(text_lower), None) is not None
+    return _KEYWORD_PREFILTER_RE.search(text_lower) is not None
+
+
+# Longest single text field scanned; longer fields are rejected outright so a
+# pathological payload cannot stall the regex engine
+MAX_SCAN_TEXT_LENGTH = 1024 * 1024
+
+# Total text (across all fields of one message) scanned before rejecting it
+MAX_SCAN_TOTAL_LENGTH = 10 * 1024 * 1024
+
+# Unbounded quantifier (+, *, {n,}) starting at a given position
+_UNBOUNDED_QUANTIFIER = re.compile(r"[+*]|\{\d*,\}")
+
+
+def _has_nested_quantifier(pattern: str) -> bool:
+    """
+    Detect a group with an unbounded quantifier that is itself repeated.
+
+    Constructs such as ``(a+)+`` or ``(.*)*`` backtrack exponentially on
+    non-matching input (ReDoS). This is a conservative textual check that
+    skips escapes and character classes.
+
+    Args:
+        pattern: Regex source to inspect.
+
+    Returns:
+        True if the pattern contains a nested unbounded quantifier.
+    """
+    # One flag per open group: does it contain an unbounded quantifier?
+    groups: list[bool] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # A leading "]" (or "^]") is a literal inside the class
+            if pattern[i + 1 : i + 2] == "^":
+                i += 1
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+        elif char == "(":
+            groups.append(False)
+        elif char == ")" and groups:
+            inner_unbounded = groups.pop()
+            if inner_unbounded and _UNBOUNDED_QUANTIFIER.match(pattern, i + 1):
+                return True
+            if inner_unbounded and groups:
+                groups[-1] = True
+        elif groups and _UNBOUNDED_QUANTIFIER.match(pattern, i):
+            groups[-1] = True
+        i += 1
+    return False
+
+
+def _lint_injection_patterns(patterns: list[str]) -> None:
+    """
+    Refuse to load injection patterns that are vulnerable to ReDoS.
+
+    Args:
+        patterns: Regex sources to check.
+
+    Raises:
+        ValueError: If any pattern contains a nested unbounded quantifier.
+    """
+    unsafe = [pattern for pattern in patterns if _has_nested_quantifier(pattern)]
+    if unsafe:
+        raise ValueError(f"Injection patterns with nested quantifiers (ReDoS risk): {unsafe}")
+
+
+# Individually compiled patterns, used to report which rule matched
+_COMPILED_PATTERNS: tuple[re.Pattern[str], ...]
+
+
+class _TextSearcher(Protocol):
+    """The part of a compiled pattern the scanners use (re or re2)."""
+
+    def search(self, string: str, /) -> Any: ...
+
+
+def _load_re2() -> Any:
+    """Import the RE2 bindings, if available."""
+    try:
+        import re2
+    except ImportError:  # optional speedup (copforge[perf]); re is used instead
+        return None
+    return re2
+
+
+_re2: Any = _load_re2()
+
+# RE2's \s and \w are ASCII-only; these classes match exactly the characters
+# re's Unicode \s and \w do
+_RE2_CLASS_BODIES = {
+    "s": r"\s\x0b\x1c-\x1f\x85\p{Z}",
+    "w": r"\p{L}\p{N}_",
+}
+
+# Escapes whose meaning differs between re and RE2 and are not rewritten
+_RE2_UNSUPPORTED_ESCAPES = frozenset("bBdDSW")
+
+
+def _to_re2_syntax(pattern: str) -> str | None:
+    """
+    Rewrite a re pattern so RE2 matches exactly the same strings.
+
+    Only \\s and \\w need rewriting for the injection patterns; patterns
+    using other Unicode-sensitive escapes return None so they stay on re.
+
+    Args:
+        pattern: Regex source written for the re module.
+
+    Returns:
+        The equivalent RE2 source, or None if parity cannot be guaranteed.
+    """
+    parts: list[str] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            escaped = pattern[i + 1 : i + 2]
+            if escaped in _RE2_UNSUPPORTED_ESCAPES:
+                return None
+            body = _RE2_CLASS_BODIES.get(escaped)
+            if body is None:
+                parts.append(pattern[i : i + 2])
+            else:
+                parts.append(body if in_class else f"[{body}]")
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        parts.append(char)
+        i += 1
+    return "".join(parts)
+
+
+def _compile_injection_re2(alternation: str, use_re2: bool) -> _TextSearcher | None:
+    """
+    Compile the injection alternation for RE2, if enabled and installed.
+
+    RE2 matches in linear time however adversarial the input, but its (?i)
+    folds case differently from re outside ASCII (e.g. dotless "ı" and "İ"
+    match "i" only under re), so it is only used for ASCII text.
+
+    Returns:
+        The compiled RE2 pattern, or None if re alone must be used.
+    """
+    if not use_re2 or _re2 is None:
+        return None
+    re2_source = _to_re2_syntax(alternation)
+    if re2_source is None:
+        return None
+    try:
+        return _re2.compile(f"(?i){re2_source}")
+    except _re2.error:  # syntax RE2 rejects: keep re
+        return None
+
+
+# Whether ASCII text is scanned with RE2 (when installed)
+USE_RE2 = True
+
+# All injection patterns as one alternation: a single pass over clean text
+# instead of one search per pattern
+_INJECTION_ALTERNATION: str
+_INJECTION_RE: re.Pattern[str]
+_INJECTION_RE2: _TextSearcher | None
+
+
+def _has_injection_match(text: str) -> bool:
+    """Return True if any injection pattern matches text (RE2 for ASCII text, else re)."""
+    if _INJECTION_RE2 is not None and text.isascii():
+        return _INJECTION_RE2.search(text) is not None
+    return _INJECTION_RE.search(text) is not None
+
+
+def set_re2_enabled(enabled: bool) -> bool:
+    """
+    Switch ASCII injection scans between RE2 and re.
+
+    Both engines detect the same patterns in ASCII text, and non-ASCII
+    text always uses re; tests use this to check the re path even when
+    re2 is installed.
+
+    Args:
+        enabled: True to use RE2 when available, False to force re.
+
+    Returns:
+        True if ASCII text is now scanned with RE2.
+    """
+    global USE_RE2, _INJECTION_RE2
+    USE_RE2 = enabled
+    _INJECTION_RE2 = _compile_injection_re2(_INJECTION_ALTERNATION, enabled)
+    return _INJECTION_RE2 is not None
+
+
+# Byte-string equivalents, for raw payloads scanned without decoding
+_COMPILED_PATTERNS_BYTES: tuple[re.Pattern[bytes], ...]
+_INJECTION_RE_BYTES: re.Pattern[bytes]
+_SUSPICIOUS_KEYWORDS_BYTES: tuple[tuple[str, bytes], ...]
+_KEYWORD_PREFILTER_RE_BYTES: re.Pattern[bytes]
+
+
+def _build_rule_tables() -> None:
+    """
+    (Re)build every matcher derived from the injection patterns and keywords.
+
+    Everything is compiled before any table is replaced, so a rejected
+    pattern set leaves the current rules in force.
+
+    Raises:
+        ValueError: If a pattern is vulnerable to ReDoS.
+        re.error: If a pattern does not compile.
+    """
+    global _SUSPICIOUS_KEYWORDS_LC, _KEYWORD_PREFILTER_RE, _KEYWORD_AUTOMATON
+    global _COMPILED_PATTERNS, _INJECTION_ALTERNATION, _INJECTION_RE, _INJECTION_RE2
+    global _COMPILED_PATTERNS_BYTES, _INJECTION_RE_BYTES
+    global _SUSPICIOUS_KEYWORDS_BYTES, _KEYWORD_PREFILTER_RE_BYTES
+
+    patterns = tuple(PROMPT_INJECTION_PATTERNS)
+    _lint_injection_patterns(list(patterns))
+    keywords_lc = tuple((keyword, keyword.lower()) for keyword in SUSPICIOUS_KEYWORDS)
+    prefilter_source = "|".join(re.escape(keyword_lower) for _, keyword_lower in keywords_lc)
+    alternation = "|".join(f"(?:{pattern})" for pattern in patterns)
+
+    compiled = tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    injection_re = re.compile(alternation, re.IGNORECASE)
+    compiled_bytes = tuple(re.compile(pattern.encode(), re.IGNORECASE) for pattern in patterns)
+    injection_re_bytes = re.compile(alternation.encode(), re.IGNORECASE)
+
+    _SUSPICIOUS_KEYWORDS_LC = keywords_lc
+    _KEYWORD_PREFILTER_RE = re.compile(prefilter_source)
+    _KEYWORD_AUTOMATON = _build_keyword_automaton(keywords_lc)
+    _COMPILED_PATTERNS = compiled
+    _INJECTION_ALTERNATION = alternation
+    _INJECTION_RE = injection_re
+    _INJECTION_RE2 = _compile_injection_re2(alternation, USE_RE2)
+    _COMPILED_PATTERNS_BYTES = compiled_bytes
+    _INJECTION_RE_BYTES = injection_re_bytes
+    _SUSPICIOUS_KEYWORDS_BYTES = tuple(
+        (keyword, keyword_lower.encode()) for keyword, keyword_lower in keywords_lc
+    )
+    _KEYWORD_PREFILTER_RE_BYTES = re.compile(prefilter_source.encode())
+
+
+_build_rule_tables()
+
+
+# Classification level -> numeric rank, and access level -> highest rank it
+# may read, so dissemination checks compare integers
+_CLASSIFICATION_CODE: dict[str, int] = {
+    level: CLASSIFICATION_HIERARCHY[level] for level in CLASSIFICATION_LEVEL_SET
+}
+_ACCESS_MAX_CODE: dict[str, int] = {
+    access_level: CLASSIFICATION_HIERARCHY[ACCESS_TO_MAX_CLASSIFICATION[access_level]]
+    for access_level in ACCESS_LEVELS
+}
+
+# Precomputed whitelist entry: (expected sensor_type or None, enabled)
+SensorAuthEntry = tuple[str | None, bool]
+
+# Whitelist as raw config dicts or as an index from build_sensor_auth_index()
+AuthorizedSensors = Mapping[str, Mapping[str, Any] | SensorAuthEntry]
+
 
 # =============================================================================
 # Internal Validation Functions
@@ -134,7 +553,7 @@ SUSPICIOUS_KEYWORDS: list[str] = [
 def _check_sensor_authorization(
     sensor_id: str,
     sensor_type: str,
-    authorized_sensors: dict[str, dict[str, Any]] | None = None,
+    authorized_sensors: AuthorizedSensors | None = None,
 ) -> tuple[bool, str]:
     """
     Validate sensor is authorized and type matches.
@@ -142,7 +561,8 @@ def _check_sensor_authorization(
     Args:
         sensor_id: Sensor identifier.
         sensor_type: Claimed sensor type.
-        authorized_sensors: Dict of authorized sensors (sensor_id -> config).
+        authorized_sensors: Authorized sensors (sensor_id -> config), either raw
+            config dicts or an index from build_sensor_auth_index().
 
     Returns:
         Tuple of (is_authorized, error_message).
@@ -151,19 +571,45 @@ def _check_sensor_authorization(
     if authorized_sensors is None:
         return True, ""
 
+    # Prebuilt indexes are immutable, so they memoize their decisions
+    if type(authorized_sensors) is SensorAuthIndex:
+        return authorized_sensors.check(sensor_id, sensor_type)
+
+    return _authorize(sensor_id, sensor_type, authorized_sensors.get(sensor_id))
+
+
+def _authorize(
+    sensor_id: str,
+    sensor_type: str,
+    sensor_config: Mapping[str, Any] | SensorAuthEntry | None,
+) -> tuple[bool, str]:
+    """
+    Decide authorization for a sensor given its whitelist entry.
+
+    Args:
+        sensor_id: Sensor identifier.
+        sensor_type: Claimed sensor type.
+        sensor_config: Whitelist entry (config dict or flat tuple), None if absent.
+
+    Returns:
+        Tuple of (is_authorized, error_message).
+    """
     # Check if sensor is in whitelist
-    if sensor_id not in authorized_sensors:
+    if sensor_config is None:
         return False, f"Unauthorized sensor: {sensor_id}"
 
-    # Validate sensor type matches configuration
-    sensor_config = authorized_sensors[sensor_id]
-    expected_type = sensor_config.get("sensor_type")
+    if isinstance(sensor_config, tuple):
+        expected_type, enabled = sensor_config
+    else:
+        expected_type, enabled = _auth_entry(sensor_config)
 
-    if expected_type and expected_type != sensor_type:
+    # Validate sensor type matches configuration; index entries and validated
+    # messages carry interned types, so a match is usually settled by identity
+    if expected_type and expected_type is not sensor_type and expected_type != sensor_type:
         return False, f"Sensor type mismatch: expected {expected_type}, got {sensor_type}"
 
     # Check if sensor is enabled
-    if not sensor_config.get("enabled", True):
+    if not enabled:
         return False, f"Sensor {sensor_id} is disabled"
 
     return True, ""
@@ -199,7 +645,20 @@ def _check_sensor_message_structure(sensor_msg: SensorMessage) -> tuple[bool, st
     return True, ""
 
 
-def _check_coordinate_validity(lat: float, lon: float) -> tuple[bool, str]:
+# Coordinate check result codes, and message templates indexed by code
+_COORD_OK = 0
+_COORD_NOT_NUMERIC = 1
+_COORD_BAD_LATITUDE = 2
+_COORD_BAD_LONGITUDE = 3
+_COORD_MESSAGES: tuple[str, ...] = (
+    "",
+    "Coordinates must be numeric (lat={lat}, lon={lon})",
+    "Latitude {lat} out of valid range [-90, 90]",
+    "Longitude {lon} out of valid range [-180, 180]",
+)
+
+
+def _coord_error_code(lat: float, lon: float) -> int:
     """
     Validate geographic coordinates are within valid ranges.
 
@@ -208,42 +667,172 @@ def _check_coordinate_validity(lat: float, lon: float) -> tuple[bool, str]:
         lon: Longitude.
 
     Returns:
-        Tuple of (is_valid, error_message).
+        _COORD_OK (0) if valid, otherwise a _COORD_* error code; the message
+        is only formatted on failure, via _coord_error_message.
     """
-    if not isinstance(lat, int | float) or not isinstance(lon, int | float):
-        return False, f"Coordinates must be numeric (lat={lat}, lon={lon})"
+    # Floats are the common case; only fall back to isinstance for the rest
+    if not (type(lat) is float or isinstance(lat, _NUM)) or not (
+        type(lon) is float or isinstance(lon, _NUM)
+    ):
+        return _COORD_NOT_NUMERIC
 
     if not (-90 <= lat <= 90):
-        return False, f"Latitude {lat} out of valid range [-90, 90]"
+        return _COORD_BAD_LATITUDE
 
     if not (-180 <= lon <= 180):
-        return False, f"Longitude {lon} out of valid range [-180, 180]"
+        return _COORD_BAD_LONGITUDE
 
-    return True, ""
+    return _COORD_OK
+
+
+def _coord_error_message(code: int, lat: float, lon: float) -> str:
+    """Format the error message for a non-zero _coord_error_code result."""
+    return _COORD_MESSAGES[code].format(lat=lat, lon=lon)
 
 
-def _check_prompt_injection(text: str) -> tuple[bool, list[str]]:
+def _oversized_issue(length: int) -> str:
+    """Describe a text field rejected for exceeding MAX_SCAN_TEXT_LENGTH."""
+    return f"Text too large to scan ({length} > {MAX_SCAN_TEXT_LENGTH})"
+
+
+def _collect_text_leaves(
+    data: dict[str, Any],
+    strings: list[str],
+    blobs: list[bytes | bytearray],
+    limit: int,
+) -> bool:
+    """
+    Gather the text fields of data into strings and blobs.
+
+    Visits the same fields as _walk_text_fields, in no particular order.
+    Returns False (leaving the lists partial) as soon as the running total
+    length passes limit.
+    """
+    remaining = limit
+    pending: list[Any] = [data]
+    while pending:
+        node = pending.pop()
+        values = node.values() if isinstance(node, dict) else node
+        for value in values:
+            if isinstance(value, str):
+                strings.append(value)
+            elif isinstance(value, bytes | bytearray):
+                blobs.append(value)
+            elif isinstance(value, dict) or (isinstance(value, list) and isinstance(node, dict)):
+                pending.append(value)
+                continue
+            else:
+                continue
+            remaining -= len(value)
+            if remaining < 0:
+                return False
+    return True
+
+
+def _text_leaves_clean(strings: list[str], blobs: list[bytes | bytearray]) -> bool:
+    """
+    Rule out injection in all text fields at once.
+
+    Fields are NUL-joined and scanned with the combined regex and keyword
+    prefilter in one pass each. The patterns use no anchors, so a field
+    that would match on its own also matches inside the joined buffer; a
+    False result only means the per-field scan must run (a match may also
+    span two fields).
+    """
+    if any(len(text) > MAX_SCAN_TEXT_LENGTH for text in strings) or any(
+        len(blob) > MAX_SCAN_TEXT_LENGTH for blob in blobs
+    ):
+        return False
+    if strings:
+        joined = "\0".join(strings)
+        if _has_injection_match(joined) or _has_suspicious_keyword(joined.lower()):
+            return False
+    if blobs:
+        joined_bytes = b"\0".join(blobs)
+        if _INJECTION_RE_BYTES.search(joined_bytes) or _KEYWORD_PREFILTER_RE_BYTES.search(
+            joined_bytes.lower()
+        ):
+            return False
+    return True
+
+
+def _check_prompt_injection(text: str, early_exit: bool = False) -> tuple[bool, list[str]]:
     """
     Check for prompt injection patterns in text.
 
     Args:
         text: Text to scan.
+        early_exit: If True, stop at (and report only) the first detection.
 
     Returns:
         Tuple of (is_safe, list_of_detected_patterns).
     """
+    if len(text) > MAX_SCAN_TEXT_LENGTH:
+        return False, [_oversized_issue(len(text))]
+
     detected_patterns: list[str] = []
+
+    # Check regex patterns (case-insensitive, so no lowered copy is needed);
+    # only identify individual patterns on a hit
+    if _has_injection_match(text):
+        for compiled in _COMPILED_PATTERNS:
+            if compiled.search(text):
+                detected_patterns.append(f"Injection pattern: {compiled.pattern[:50]}...")
+                if early_exit:
+                    return False, detected_patterns
+
+    # Check suspicious keywords; clean text is ruled out with a single scan
     text_lower = text.lower()
+    if not _has_suspicious_keyword(text_lower):
+        return not detected_patterns, detected_patterns
+    for keyword, keyword_lower in _SUSPICIOUS_KEYWORDS_LC:
+        if keyword_lower in text_lower:
+            detected_patterns.append(f"Suspicious keyword: '{keyword}'")
+            if early_exit:
+                return False, detected_patterns
+
+    is_safe = len(detected_patterns) == 0
+    return is_safe, detected_patterns
+
+
+def _check_prompt_injection_bytes(
+    data: bytes | bytearray,
+    early_exit: bool = False,
+) -> tuple[bool, list[str]]:
+    """
+    Check for prompt injection patterns in a raw byte payload.
+
+    Scans the bytes directly (no UTF-8 decode) and reports issues in the
+    same format as _check_prompt_injection.
+
+    Args:
+        data: Bytes to scan.
+        early_exit: If True, stop at (and report only) the first detection.
+
+    Returns:
+        Tuple of (is_safe, list_of_detected_patterns).
+    """
+    if len(data) > MAX_SCAN_TEXT_LENGTH:
+        return False, [_oversized_issue(len(data))]
 
-    # Check regex patterns
-    for pattern in PROMPT_INJECTION_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            detected_patterns.append(f"Injection pattern: {pattern[:50]}...")
+    detected_patterns: list[str] = []
 
-    # Check suspicious keywords
-    for keyword in SUSPICIOUS_KEYWORDS:
-        if keyword.lower() in text_lower:
+    if _INJECTION_RE_BYTES.search(data):
+        for compiled in _COMPILED_PATTERNS_BYTES:
+            if compiled.search(data):
+                pattern = compiled.pattern.decode()
+                detected_patterns.append(f"Injection pattern: {pattern[:50]}...")
+                if early_exit:
+                    return False, detected_patterns
+
+    data_lower = data.lower()
+    if not _KEYWORD_PREFILTER_RE_BYTES.search(data_lower):
+        return not detected_patterns, detected_patterns
+    for keyword, keyword_bytes in _SUSPICIOUS_KEYWORDS_BYTES:
+        if keyword_bytes in data_lower:
             detected_patterns.append(f"Suspicious keyword: '{keyword}'")
+            if early_exit:
+                return False, detected_patterns
 
     is_safe = len(detected_patterns) == 0
     return is_safe, detected_patterns
@@ -252,6 +841,7 @@ def _check_prompt_injection(text: str) -> tuple[bool, list[str]]:
 def _scan_text_fields(
     data: dict[str, Any],
     path: str = "",
+    early_exit: bool = False,
 ) -> tuple[bool, list[str]]:
     """
     Recursively scan all text fields in data for injection attempts.
@@ -259,92 +849,230 @@ def _scan_text_fields(
     Args:
         data: Dictionary to scan.
         path: Current path in nested structure (for error reporting).
+        early_exit: If True, stop at (and report only) the first issue.
 
     Returns:
         Tuple of (is_safe, list_of_issues).
     """
+    strings: list[str] = []
+    blobs: list[bytes | bytearray] = []
+    if not _collect_text_leaves(data, strings, blobs, MAX_SCAN_TOTAL_LENGTH):
+        return False, [f"Message text too large to scan (> {MAX_SCAN_TOTAL_LENGTH})"]
+
+    # Common case: one scan over all fields proves the message clean
+    if _text_leaves_clean(strings, blobs):
+        return True, []
+
+    # Otherwise locate the offending fields for precise reporting
     all_issues: list[str] = []
+    _walk_text_fields(data, path, all_issues, early_exit)
 
-    for key, value in data.items():
-        current_path = f"{path}.{key}" if path else key
+    is_safe = len(all_issues) == 0
+    return is_safe, all_issues
+
+
+def _walk_text_fields(
+    data: dict[str, Any],
+    path: str,
+    all_issues: list[str],
+    early_exit: bool,
+) -> None:
+    """
+    Append text-field issues to all_issues in field order.
+
+    Walks data depth-first with an explicit stack of entry iterators, so
+    issues come out in the same order as a recursive traversal would give.
+    Each entry is (path, value, in_list); lists nested directly in lists
+    are not descended into.
+    """
+    frames: list[Iterator[tuple[str, Any, bool]]] = [_dict_entries(data, path)]
+    while frames:
+        for current_path, value, in_list in frames[-1]:
+            if isinstance(value, str):
+                is_safe, issues = _check_prompt_injection(value, early_exit)
+
+            # Raw bytes are scanned as-is rather than skipped
+            elif isinstance(value, bytes | bytearray):
+                is_safe, issues = _check_prompt_injection_bytes(value, early_exit)
+
+            # Descend into the container, resuming this frame afterwards
+            elif isinstance(value, dict):
+                frames.append(_dict_entries(value, current_path))
+                break
+            elif isinstance(value, list) and not in_list:
+                frames.append(_list_entries(value, current_path))
+                break
+            else:
+                continue
 
-        # If value is string, check it
-        if isinstance(value, str):
-            is_safe, issues = _check_prompt_injection(value)
             if not is_safe:
                 for issue in issues:
                     all_issues.append(f"{current_path}: {issue}")
+                if early_exit:
+                    return
+        else:
+            frames.pop()
 
-        # If value is dict, recurse
-        elif isinstance(value, dict):
-            is_safe, issues = _scan_text_fields(value, current_path)
-            if not is_safe:
-                all_issues.extend(issues)
-
-        # If value is list, check each item
-        elif isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, str):
-                    is_safe, issues = _check_prompt_injection(item)
-                    if not is_safe:
-                        for issue in issues:
-                            all_issues.append(f"{current_path}[{i}]: {issue}")
-                elif isinstance(item, dict):
-                    is_safe, issues = _scan_text_fields(item, f"{current_path}[{i}]")
-                    if not is_safe:
-                        all_issues.extend(issues)
 
-    is_safe = len(all_issues) == 0
-    return is_safe, all_issues
+def _dict_entries(data: dict[str, Any], path: str) -> Iterator[tuple[str, Any, bool]]:
+    """Yield (path, value, in_list) for each item of a dict at path."""
+    for key, value in data.items():
+        yield (f"{path}.{key}" if path else key), value, False
+
 
+def _list_entries(data: list[Any], path: str) -> Iterator[tuple[str, Any, bool]]:
+    """Yield (path, value, in_list) for each item of a list at path."""
+    for i, item in enumerate(data):
+        yield f"{path}[{i}]", item, True
 
-def _scan_coordinates_in_data(data: dict[str, Any]) -> tuple[bool, list[str]]:
+
+def _scan_coordinates_in_data(
+    data: dict[str, Any],
+    early_exit: bool = False,
+) -> tuple[bool, list[str]]:
     """
     Scan data for coordinate fields and validate them.
 
+    Coordinate pairs are collected first and then range-checked as a batch,
+    vectorized with NumPy when there are many of them (multi-target reports).
+
     Args:
         data: Data dictionary to scan.
+        early_exit: If True, stop at (and report only) the first issue.
 
     Returns:
         Tuple of (is_valid, list_of_issues).
     """
-    issues: list[str] = []
+    pairs: list[tuple[str, Any, Any]] = []
+    _collect_coordinates(data, "", pairs)
+
+    issues = _coordinate_issues(pairs, early_exit)
+    is_valid = len(issues) == 0
+    return is_valid, issues
 
-    # Check top-level coordinates
-    if "location" in data and isinstance(data["location"], dict):
-        lat = data["location"].get("lat")
-        lon = data["location"].get("lon")
+
+def _collect_coordinates(
+    data: dict[str, Any],
+    prefix: str,
+    pairs: list[tuple[str, Any, Any]],
+) -> None:
+    """
+    Append (label, lat, lon) for every coordinate pair in data, in report order.
+
+    Iterative pre-order walk: children are pushed in reverse so they are
+    popped in key order, matching the order of a recursive traversal.
+    """
+    pending: list[tuple[dict[str, Any], str]] = [(data, prefix)]
+    while pending:
+        node, prefix = pending.pop()
+
+        # Top-level location object
+        location = node.get("location")
+        if isinstance(location, dict):
+            lat = location.get("lat")
+            lon = location.get("lon")
+
+            if lat is not None and lon is not None:
+                pairs.append((f"{prefix}location", lat, lon))
+
+        # Direct lat/lon fields
+        lat = node.get("latitude") or node.get("lat")
+        lon = node.get("longitude") or node.get("lon")
 
         if lat is not None and lon is not None:
-            is_valid, error = _check_coordinate_validity(lat, lon)
-            if not is_valid:
-                issues.append(f"location: {error}")
+            pairs.append((f"{prefix}coordinates", lat, lon))
 
-    # Check direct lat/lon fields
-    lat = data.get("latitude") or data.get("lat")
-    lon = data.get("longitude") or data.get("lon")
+        # Queue nested structures
+        children: list[tuple[dict[str, Any], str]] = []
+        for key, value in node.items():
+            if isinstance(value, dict) and key != "location":
+                children.append((value, f"{prefix}{key}."))
 
-    if lat is not None and lon is not None:
-        is_valid, error = _check_coordinate_validity(lat, lon)
-        if not is_valid:
-            issues.append(f"coordinates: {error}")
+            elif isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, dict):
+                        children.append((item, f"{prefix}{key}[{i}]."))
+        pending.extend(reversed(children))
 
-    # Recursively check nested structures
-    for key, value in data.items():
-        if isinstance(value, dict) and key != "location":
-            is_valid, nested_issues = _scan_coordinates_in_data(value)
-            if not is_valid:
-                issues.extend([f"{key}.{issue}" for issue in nested_issues])
 
-        elif isinstance(value, list):
-            for i, item in enumerate(value):
-                if isinstance(item, dict):
-                    is_valid, nested_issues = _scan_coordinates_in_data(item)
-                    if not is_valid:
-                        issues.extend([f"{key}[{i}].{issue}" for issue in nested_issues])
+def _coordinate_issues(
+    pairs: list[tuple[str, Any, Any]],
+    early_exit: bool,
+) -> list[str]:
+    """
+    Validate collected coordinate pairs, returning issues in collection order.
+
+    Args:
+        pairs: (label, lat, lon) triples from _collect_coordinates.
+        early_exit: If True, stop at the first issue.
+
+    Returns:
+        List of "label: error" issues.
+    """
+    candidates: Iterable[int] = range(len(pairs))
+    if len(pairs) >= VECTORIZE_MIN_COORDINATES:
+        arrays = _coordinate_arrays(pairs)
+        if arrays is not None:
+            if early_exit:
+                first = _first_invalid_coordinate(*arrays)
+                candidates = [] if first < 0 else [first]
+            else:
+                candidates = _invalid_coordinate_indices(*arrays)
+
+    # Scalar check on the candidates produces the exact error messages
+    issues: list[str] = []
+    for index in candidates:
+        label, lat, lon = pairs[index]
+        code = _coord_error_code(lat, lon)
+        if code:
+            issues.append(f"{label}: {_coord_error_message(code, lat, lon)}")
+            if early_exit:
+                break
+    return issues
+
+
+def _coordinate_arrays(
+    pairs: list[tuple[str, Any, Any]],
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Pack coordinate pairs into float64 latitude and longitude arrays.
+
+    Returns:
+        (lats, lons), or None if any value is not a plain number (the
+        scalar path then reports it).
+    """
+    for _, lat, lon in pairs:
+        if not (isinstance(lat, _NUM) and isinstance(lon, _NUM)):
+            return None
+
+    count = len(pairs)
+    try:
+        lats = np.fromiter((pair[1] for pair in pairs), dtype=np.float64, count=count)
+        lons = np.fromiter((pair[2] for pair in pairs), dtype=np.float64, count=count)
+    except OverflowError:
+        return None
+    return lats, lons
+
+
+def _valid_coordinate_mask(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized range check; NaN compares false and so is invalid."""
+    return (lats >= -90) & (lats <= 90) & (lons >= -180) & (lons <= 180)
+
+
+def _invalid_coordinate_indices(lats: np.ndarray, lons: np.ndarray) -> list[int]:
+    """Indices of all out-of-range coordinate pairs, in order."""
+    valid = _valid_coordinate_mask(lats, lons)
+    if valid.all():
+        return []
+    return [int(index) for index in np.flatnonzero(~valid)]
 
-    is_valid = len(issues) == 0
-    return is_valid, issues
+
+def _first_invalid_coordinate(lats: np.ndarray, lons: np.ndarray) -> int:
+    """Index of the first out-of-range coordinate pair, or -1 if all are valid."""
+    valid = _valid_coordinate_mask(lats, lons)
+    if valid.all():
+        return -1
+    return int(np.argmin(valid))
 
 
 def _check_classification_validity(classification: str) -> tuple[bool, str]:
@@ -360,11 +1088,12 @@ def _check_classification_validity(classification: str) -> tuple[bool, str]:
     if classification.lower() not in CLASSIFICATIONS:
         return (
             False,
-            f"Invalid classification '{classification}'. Must be one of: {CLASSIFICATIONS}",
+            f"Invalid classification '{classification}'. Must be one of: {sorted(CLASSIFICATIONS)}",
         )
     return True, ""
 
 
+@lru_cache(maxsize=256)
 def _check_information_classification_validity(level: str) -> tuple[bool, str]:
     """
     Validate security classification level.
@@ -378,11 +1107,12 @@ def _check_information_classification_validity(level: str) -> tuple[bool, str]:
     if level.upper() not in CLASSIFICATION_LEVEL_SET:
         return (
             False,
-            f"Invalid classification level '{level}'. Must be one of: {CLASSIFICATION_LEVEL_SET}",
+            f"Invalid classification level '{level}'. Must be one of: {CLASSIFICATION_LEVELS}",
         )
     return True, ""
 
 
+@lru_cache(maxsize=256)
 def _check_access_level_validity(access_level: str) -> tuple[bool, str]:
     """
     Validate access level.
@@ -394,19 +1124,231 @@ def _check_access_level_validity(access_level: str) -> tuple[bool, str]:
         Tuple of (is_valid, error_message).
     """
     if access_level.lower() not in ACCESS_LEVELS:
-        return False, f"Invalid access level '{access_level}'. Must be one of: {ACCESS_LEVELS}"
+        return (
+            False,
+            f"Invalid access level '{access_level}'. Must be one of: {sorted(ACCESS_LEVELS)}",
+        )
     return True, ""
 
 
+# =============================================================================
+# Sensor Authorization Index
+# =============================================================================
+
+
+def _auth_entry(sensor_config: Mapping[str, Any]) -> SensorAuthEntry:
+    """Flatten a sensor config dict to (expected_type, enabled)."""
+    return sensor_config.get("sensor_type"), bool(sensor_config.get("enabled", True))
+
+
+def _index_entry(sensor_config: Mapping[str, Any]) -> SensorAuthEntry:
+    """Flatten a sensor config for SensorAuthIndex, interning the expected type."""
+    expected_type, enabled = _auth_entry(sensor_config)
+    if isinstance(expected_type, str):
+        expected_type = sys.intern(expected_type)
+    return expected_type, enabled
+
+
+# Maximum (sensor_id, sensor_type) decisions memoized per SensorAuthIndex
+AUTH_DECISION_CACHE_SIZE = 4096
+
+
+class SensorAuthIndex(Mapping[str, SensorAuthEntry]):
+    """
+    Read-only sensor whitelist index with memoized authorization decisions.
+
+    Maps sensor_id -> (expected sensor_type, enabled). Because the index
+    cannot change after construction, decisions per (sensor_id, sensor_type)
+    are cached on the instance (FIFO-bounded) and discarded with it.
+    """
+
+    def __init__(self, entries: dict[str, SensorAuthEntry]) -> None:
+        self._entries = entries
+        self._decisions: dict[tuple[str, str], tuple[bool, str]] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, sensor_id: str) -> SensorAuthEntry:
+        return self._entries[sensor_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild from entries only (e.g. for worker processes); locks don't pickle
+        return (SensorAuthIndex, (self._entries,))
+
+    def get(self, sensor_id: str, default: Any = None) -> Any:
+        """Return the entry for sensor_id, or default."""
+        return self._entries.get(sensor_id, default)
+
+    def check(self, sensor_id: str, sensor_type: str) -> tuple[bool, str]:
+        """
+        Return the (memoized) authorization decision for a sensor.
+
+        Args:
+            sensor_id: Sensor identifier.
+            sensor_type: Claimed sensor type.
+
+        Returns:
+            Tuple of (is_authorized, error_message).
+        """
+        key = (sensor_id, sensor_type)
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = _authorize(sensor_id, sensor_type, self._entries.get(sensor_id))
+            with self._lock:
+                if len(self._decisions) >= AUTH_DECISION_CACHE_SIZE:
+                    del self._decisions[next(iter(self._decisions))]
+                self._decisions[key] = decision
+        return decision
+
+
+def build_sensor_auth_index(
+    authorized_sensors: Mapping[str, Mapping[str, Any]],
+) -> SensorAuthIndex:
+    """
+    Precompute a flat authorization index from sensor config dicts.
+
+    Build this once when the whitelist is loaded and pass it as
+    authorized_sensors; each check then costs one lookup instead of three,
+    and repeat (sensor_id, sensor_type) pairs hit a per-index decision cache.
+    Sensor IDs and expected types are interned, like the fields of
+    SensorMessage, so lookups and type checks for validated messages match
+    on identity first. The index is a read-only snapshot, so rebuild it
+    when the config changes.
+
+    Args:
+        authorized_sensors: Dict of authorized sensors (sensor_id -> config).
+
+    Returns:
+        Read-only mapping of sensor_id -> (expected sensor_type, enabled).
+
+    Example:
+        >>> index = build_sensor_auth_index(sensor_configs)
+        >>> result = validate_sensor_input(sensor_msg, authorized_sensors=index)
+    """
+    return SensorAuthIndex(
+        {
+            sys.intern(sensor_id): _index_entry(config)
+            for sensor_id, config in authorized_sensors.items()
+        }
+    )
+
+
+# =============================================================================
+# Rule Reloading
+# =============================================================================
+
+# Messages handed to each worker process per task in validate_sensor_inputs
+BATCH_CHUNK_SIZE = 64
+
+# Serializes rebuilds of the rule tables and stats
+_rules_lock = Lock()
+
+
+def invalidate_validation_cache() -> None:
+    """
+    Reload the detection rules.
+
+    Call this after hot-updating PROMPT_INJECTION_PATTERNS, SUSPICIOUS_KEYWORDS
+    or any other rule set: the compiled matchers and firewall stats are
+    rebuilt from the current lists, and validate_sensor_inputs starts new
+    worker processes that load them.
+
+    Raises:
+        ValueError: If an updated pattern is vulnerable to ReDoS; the
+            previous rules stay in force.
+    """
+    _reload_rules()
+    # Workers hold their own copy of the rules; later batches start fresh ones
+    _shutdown_worker_pool(wait=False)
+
+
+def _reload_rules() -> None:
+    """Rebuild the rule tables and stats from the current rule lists."""
+    global _FIREWALL_STATS
+    with _rules_lock:
+        _build_rule_tables()
+        _FIREWALL_STATS = _build_firewall_stats()
+
+
 # =============================================================================
 # Main Firewall Functions
 # =============================================================================
 
 
+def _check_details(
+    passed_mask: int,
+    failed: str | None = None,
+    **identity: Any,
+) -> dict[str, Any]:
+    """
+    Build a details dict describing validation progress.
+
+    Only called on failure or when the caller asked for details, so the
+    success fast path never allocates it.
+
+    Args:
+        passed_mask: CHECK_* bits of the checks that passed.
+        failed: Name of the check that failed, if any.
+        identity: Identifying fields to include first (e.g. sensor_id).
+
+    Returns:
+        Details dict with identity fields, checks_passed and checks_failed.
+    """
+    return {
+        **identity,
+        "checks_passed": _decode_checks(passed_mask),
+        "checks_failed": [failed] if failed else [],
+    }
+
+
+def validate_sensor_input_strict(
+    sensor_msg: SensorMessage,
+    authorized_sensors: AuthorizedSensors | None = None,
+    collect_details: bool = False,
+) -> FirewallResult:
+    """
+    Validate a sensor message with strict_mode fixed on (any issue blocks it).
+
+    For deployments whose strictness is fixed; see validate_sensor_input.
+    """
+    return validate_sensor_input(sensor_msg, authorized_sensors, True, collect_details)
+
+
+def validate_sensor_input_lenient(
+    sensor_msg: SensorMessage,
+    authorized_sensors: AuthorizedSensors | None = None,
+    collect_details: bool = False,
+) -> FirewallResult:
+    """
+    Validate a sensor message with strict_mode fixed off (injection only warns).
+
+    For deployments whose strictness is fixed; see validate_sensor_input.
+    """
+    return validate_sensor_input(sensor_msg, authorized_sensors, False, collect_details)
+
+
+def _sensor_details(
+    sensor_msg: SensorMessage, passed_mask: int, failed: str | None = None
+) -> dict[str, Any]:
+    """Build validate_sensor_input details for a message."""
+    return _check_details(
+        passed_mask,
+        failed,
+        sensor_id=sensor_msg.sensor_id,
+        sensor_type=sensor_msg.sensor_type,
+    )
+
+
 def validate_sensor_input(
     sensor_msg: SensorMessage,
-    authorized_sensors: dict[str, dict[str, Any]] | None = None,
+    authorized_sensors: AuthorizedSensors | None = None,
     strict_mode: bool = True,
+    collect_details: bool = False,
 ) -> FirewallResult:
     """
     Validate incoming sensor message for security threats.
@@ -417,10 +1359,18 @@ def validate_sensor_input(
     3. Prompt injection detection
     4. Coordinate validation
 
+    These layers run for every sensor type: they guard against hostile
+    content, which any sensor may carry. Format-specific structure checks
+    (ASTERIX tracks, radio channels, ...) belong to the parser selected for
+    the message's sensor type.
+
     Args:
         sensor_msg: Sensor message to validate.
-        authorized_sensors: Dict of authorized sensors (optional whitelist).
+        authorized_sensors: Authorized sensors (optional whitelist), as config dicts
+            or an index from build_sensor_auth_index().
         strict_mode: If True, fail on any security issue. If False, add warnings.
+        collect_details: If True, passing results also carry the details dict.
+            Failures always include details.
 
     Returns:
         FirewallResult with validation status and details.
@@ -430,8 +1380,7 @@ def validate_sensor_input(
         >>> if not result.is_valid:
         ...     print(f"Blocked: {result.error}")
     """
-    with traced_operation(
-        tracer,
+    with _span(
         "validate_sensor_input",
         {
             "sensor_id": sensor_msg.sensor_id,
@@ -440,12 +1389,7 @@ def validate_sensor_input(
         },
     ) as span:
         warnings: list[str] = []
-        details: dict[str, Any] = {
-            "sensor_id": sensor_msg.sensor_id,
-            "sensor_type": sensor_msg.sensor_type,
-            "checks_passed": [],
-            "checks_failed": [],
-        }
+        passed_mask = 0
 
         # Check 1: Sensor authorization
         is_authorized, error = _check_sensor_authorization(
@@ -454,76 +1398,260 @@ def validate_sensor_input(
             authorized_sensors,
         )
         if not is_authorized:
-            details["checks_failed"].append("sensor_authorization")
             span.set_attribute("firewall.result", "blocked")
             span.set_attribute("firewall.reason", "sensor_authorization")
             return FirewallResult(
                 is_valid=False,
                 error=f"[FIREWALL] {error}",
-                details=details,
+                details=_sensor_details(sensor_msg, passed_mask, "sensor_authorization"),
+                passed_mask=passed_mask,
             )
-        details["checks_passed"].append("sensor_authorization")
+        passed_mask |= CHECK_SENSOR_AUTHORIZATION
 
         # Check 2: Message structure validation
         is_valid, error = _check_sensor_message_structure(sensor_msg)
         if not is_valid:
-            details["checks_failed"].append("message_structure")
             span.set_attribute("firewall.result", "blocked")
             span.set_attribute("firewall.reason", "message_structure")
             return FirewallResult(
                 is_valid=False,
                 error=f"[FIREWALL] Structure error: {error}",
-                details=details,
+                details=_sensor_details(sensor_msg, passed_mask, "message_structure"),
+                passed_mask=passed_mask,
             )
-        details["checks_passed"].append("message_structure")
+        passed_mask |= CHECK_MESSAGE_STRUCTURE
 
         # Check 3: Scan all text fields for prompt injection
         if isinstance(sensor_msg.data, dict):
-            is_safe, issues = _scan_text_fields(sensor_msg.data)
+            # A strict caller that did not ask for details only needs the
+            # first issue, so stop scanning there
+            early_exit = strict_mode and not collect_details
+            is_safe, issues = _scan_text_fields(sensor_msg.data, early_exit=early_exit)
             if not is_safe:
                 error_msg = "[FIREWALL] Prompt injection detected:\n" + "\n".join(issues)
                 if strict_mode:
-                    details["checks_failed"].append("prompt_injection")
-                    details["injection_issues"] = issues
                     span.set_attribute("firewall.result", "blocked")
                     span.set_attribute("firewall.reason", "prompt_injection")
                     return FirewallResult(
                         is_valid=False,
                         error=error_msg,
-                        details=details,
+                        details={
+                            **_sensor_details(sensor_msg, passed_mask, "prompt_injection"),
+                            "injection_issues": issues,
+                        },
+                        passed_mask=passed_mask,
                     )
                 else:
                     # In non-strict mode, add warning but continue
                     warnings.append(error_msg)
-            details["checks_passed"].append("prompt_injection")
+            passed_mask |= CHECK_PROMPT_INJECTION
 
             # Check 4: Validate all coordinates in data
-            is_valid, issues = _scan_coordinates_in_data(sensor_msg.data)
+            is_valid, issues = _scan_coordinates_in_data(
+                sensor_msg.data, early_exit=not collect_details
+            )
             if not is_valid:
                 error_msg = "[FIREWALL] Invalid coordinates:\n" + "\n".join(issues)
-                details["checks_failed"].append("coordinate_validation")
-                details["coordinate_issues"] = issues
                 span.set_attribute("firewall.result", "blocked")
                 span.set_attribute("firewall.reason", "invalid_coordinates")
                 return FirewallResult(
                     is_valid=False,
                     error=error_msg,
-                    details=details,
+                    details={
+                        **_sensor_details(sensor_msg, passed_mask, "coordinate_validation"),
+                        "coordinate_issues": issues,
+                    },
+                    passed_mask=passed_mask,
                 )
-            details["checks_passed"].append("coordinate_validation")
+            passed_mask |= CHECK_COORDINATE_VALIDATION
 
         # All checks passed
         span.set_attribute("firewall.result", "passed")
         span.set_attribute("firewall.warnings_count", len(warnings))
 
-        return FirewallResult(
-            is_valid=True,
-            warnings=warnings,
-            details=details,
+        if collect_details:
+            return FirewallResult(
+                is_valid=True,
+                warnings=tuple(warnings),
+                details=_sensor_details(sensor_msg, passed_mask),
+                passed_mask=passed_mask,
+            )
+        if warnings:
+            return FirewallResult(is_valid=True, warnings=tuple(warnings), passed_mask=passed_mask)
+        return _ok_result(passed_mask)
+
+
+# Worker pool for validate_sensor_inputs as (worker count, pool), started on
+# first use and reused by later batches; replaced when the rules change and
+# shut down at interpreter exit
+_worker_pool_state: tuple[int, ProcessPoolExecutor] | None = None
+_worker_pool_lock = Lock()
+
+
+def _usable_cpu_count() -> int:
+    """CPUs this process may run on, honouring CPU affinity where available."""
+    if sys.version_info >= (3, 13):
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _load_worker_rules(patterns: tuple[str, ...], keywords: tuple[str, ...]) -> None:
+    """Pool initializer: install the parent's current rules in a worker."""
+    PROMPT_INJECTION_PATTERNS[:] = patterns
+    SUSPICIOUS_KEYWORDS[:] = keywords
+    _reload_rules()
+
+
+def _worker_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool, (re)starting it with max_workers workers."""
+    global _worker_pool_state
+    with _worker_pool_lock:
+        stale = _worker_pool_state
+        if stale is not None and stale[0] == max_workers:
+            return stale[1]
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_load_worker_rules,
+            initargs=(tuple(PROMPT_INJECTION_PATTERNS), tuple(SUSPICIOUS_KEYWORDS)),
         )
+        _worker_pool_state = (max_workers, pool)
+    if stale is not None:
+        stale[1].shutdown(wait=False)
+    return pool
 
 
-def validate_entity(entity: EntityCOP) -> FirewallResult:
+@atexit.register
+def _shutdown_worker_pool(wait: bool = True) -> None:
+    """Shut down the shared process pool, if one is running."""
+    global _worker_pool_state
+    with _worker_pool_lock:
+        state, _worker_pool_state = _worker_pool_state, None
+    if state is not None:
+        state[1].shutdown(wait=wait, cancel_futures=wait)
+
+
+def validate_sensor_inputs(
+    sensor_msgs: Sequence[SensorMessage],
+    authorized_sensors: AuthorizedSensors | None = None,
+    strict_mode: bool = True,
+    max_workers: int | None = None,
+    collect_details: bool = False,
+) -> list[FirewallResult]:
+    """
+    Validate a batch of sensor messages across CPU cores.
+
+    Each message is validated independently with validate_sensor_input in a
+    process pool that is kept for later batches until the rules change
+    (see invalidate_validation_cache). Batches no larger than one
+    chunk, or a single usable CPU, are validated in-process, where handing
+    work to other processes would cost more than it saves. Async callers
+    should run this via ``loop.run_in_executor`` to avoid blocking the event
+    loop.
+
+    Args:
+        sensor_msgs: Sensor messages to validate.
+        authorized_sensors: Dict of authorized sensors (optional whitelist).
+        strict_mode: If True, fail on any security issue. If False, add warnings.
+        max_workers: Worker process count, capped at (and defaulting to) the
+            usable CPU count.
+        collect_details: If True, passing results also carry the details dict.
+
+    Returns:
+        List of FirewallResult, in the same order as sensor_msgs.
+    """
+    validate = partial(
+        validate_sensor_input,
+        authorized_sensors=authorized_sensors,
+        strict_mode=strict_mode,
+        collect_details=collect_details,
+    )
+
+    # More processes than usable CPUs only adds scheduling and IPC overhead
+    workers = min(max_workers or _usable_cpu_count(), _usable_cpu_count())
+    if len(sensor_msgs) <= BATCH_CHUNK_SIZE or workers == 1:
+        return [validate(sensor_msg) for sensor_msg in sensor_msgs]
+
+    executor = _worker_pool(workers)
+    return list(executor.map(validate, sensor_msgs, chunksize=BATCH_CHUNK_SIZE))
+
+
+def _entity_failure(entity: EntityCOP, passed_mask: int, failed: str, error: str) -> FirewallResult:
+    """Build a failed validate_entity result with details."""
+    return FirewallResult(
+        is_valid=False,
+        error=f"[FIREWALL] {error}",
+        details=_check_details(
+            passed_mask,
+            failed,
+            entity_id=entity.entity_id,
+            entity_type=entity.entity_type,
+        ),
+        passed_mask=passed_mask,
+    )
+
+
+def _entity_classification_error(entity: EntityCOP) -> str | None:
+    is_valid, error = _check_classification_validity(entity.classification)
+    return None if is_valid else error
+
+
+def _entity_information_classification_error(entity: EntityCOP) -> str | None:
+    is_valid, error = _check_information_classification_validity(entity.information_classification)
+    return None if is_valid else error
+
+
+def _entity_coordinates_error(entity: EntityCOP) -> str | None:
+    location = entity.location
+    code = _coord_error_code(location.lat, location.lon)
+    return _coord_error_message(code, location.lat, location.lon) if code else None
+
+
+def _entity_confidence_error(entity: EntityCOP) -> str | None:
+    if not (0.0 <= entity.confidence <= 1.0):
+        return f"Confidence {entity.confidence} out of range [0.0, 1.0]"
+    return None
+
+
+def _entity_speed_error(entity: EntityCOP) -> str | None:
+    if entity.speed_kmh is not None and entity.speed_kmh < 0:
+        return f"Speed cannot be negative: {entity.speed_kmh}"
+    return None
+
+
+def _entity_heading_error(entity: EntityCOP) -> str | None:
+    if entity.heading is not None and not (0 <= entity.heading < 360):
+        return f"Heading {entity.heading} out of range [0, 360)"
+    return None
+
+
+def _entity_comments_error(entity: EntityCOP) -> str | None:
+    if entity.comments:
+        is_safe, issues = _check_prompt_injection(entity.comments, early_exit=True)
+        if not is_safe:
+            return f"Injection in comments: {issues[0]}"
+    return None
+
+
+# Entity checks in evaluation order: (check bit, failure name, check).
+# Each check returns an error message, or None when it passes.
+_ENTITY_CHECKS: tuple[tuple[int, str, Callable[[EntityCOP], str | None]], ...] = (
+    (CHECK_CLASSIFICATION, "classification", _entity_classification_error),
+    (
+        CHECK_INFORMATION_CLASSIFICATION,
+        "information_classification",
+        _entity_information_classification_error,
+    ),
+    (CHECK_COORDINATES, "coordinates", _entity_coordinates_error),
+    (CHECK_CONFIDENCE, "confidence", _entity_confidence_error),
+    (CHECK_SPEED, "speed", _entity_speed_error),
+    (CHECK_HEADING, "heading", _entity_heading_error),
+    (CHECK_COMMENTS, "comments_injection", _entity_comments_error),
+)
+
+
+def validate_entity(entity: EntityCOP, collect_details: bool = False) -> FirewallResult:
     """
     Validate EntityCOP for security and data integrity.
 
@@ -537,6 +1665,8 @@ def validate_entity(entity: EntityCOP) -> FirewallResult:
 
     Args:
         entity: EntityCOP to validate.
+        collect_details: If True, passing results also carry the details dict.
+            Failures always include details.
 
     Returns:
         FirewallResult with validation status and details.
@@ -546,105 +1676,40 @@ def validate_entity(entity: EntityCOP) -> FirewallResult:
         >>> if not result.is_valid:
         ...     print(f"Invalid: {result.error}")
     """
-    with traced_operation(
-        tracer,
+    with _span(
         "validate_entity",
         {
             "entity_id": entity.entity_id,
             "entity_type": entity.entity_type,
         },
     ) as span:
-        details: dict[str, Any] = {
-            "entity_id": entity.entity_id,
-            "entity_type": entity.entity_type,
-            "checks_passed": [],
-            "checks_failed": [],
-        }
-
-        # Check IFF classification
-        is_valid, error = _check_classification_validity(entity.classification)
-        if not is_valid:
-            details["checks_failed"].append("classification")
-            span.set_attribute("firewall.result", "invalid")
-            return FirewallResult(is_valid=False, error=f"[FIREWALL] {error}", details=details)
-        details["checks_passed"].append("classification")
-
-        # Check information classification
-        is_valid, error = _check_information_classification_validity(
-            entity.information_classification
-        )
-        if not is_valid:
-            details["checks_failed"].append("information_classification")
-            span.set_attribute("firewall.result", "invalid")
-            return FirewallResult(is_valid=False, error=f"[FIREWALL] {error}", details=details)
-        details["checks_passed"].append("information_classification")
-
-        # Check coordinates
-        is_valid, error = _check_coordinate_validity(
-            entity.location.lat,
-            entity.location.lon,
-        )
-        if not is_valid:
-            details["checks_failed"].append("coordinates")
-            span.set_attribute("firewall.result", "invalid")
-            return FirewallResult(is_valid=False, error=f"[FIREWALL] {error}", details=details)
-        details["checks_passed"].append("coordinates")
-
-        # Check confidence range
-        if not (0.0 <= entity.confidence <= 1.0):
-            details["checks_failed"].append("confidence")
-            span.set_attribute("firewall.result", "invalid")
-            return FirewallResult(
-                is_valid=False,
-                error=f"[FIREWALL] Confidence {entity.confidence} out of range [0.0, 1.0]",
-                details=details,
-            )
-        details["checks_passed"].append("confidence")
-
-        # Check optional fields
-        if entity.speed_kmh is not None and entity.speed_kmh < 0:
-            details["checks_failed"].append("speed")
-            span.set_attribute("firewall.result", "invalid")
-            return FirewallResult(
-                is_valid=False,
-                error=f"[FIREWALL] Speed cannot be negative: {entity.speed_kmh}",
-                details=details,
-            )
-        details["checks_passed"].append("speed")
-
-        if entity.heading is not None and not (0 <= entity.heading < 360):
-            details["checks_failed"].append("heading")
-            span.set_attribute("firewall.result", "invalid")
-            return FirewallResult(
-                is_valid=False,
-                error=f"[FIREWALL] Heading {entity.heading} out of range [0, 360)",
-                details=details,
-            )
-        details["checks_passed"].append("heading")
-
-        # Check for prompt injection in comments
-        if entity.comments:
-            is_safe, issues = _check_prompt_injection(entity.comments)
-            if not is_safe:
-                details["checks_failed"].append("comments_injection")
+        passed_mask = 0
+        for check_bit, check_name, check in _ENTITY_CHECKS:
+            error = check(entity)
+            if error is not None:
                 span.set_attribute("firewall.result", "invalid")
-                return FirewallResult(
-                    is_valid=False,
-                    error=f"[FIREWALL] Injection in comments: {issues[0]}",
-                    details=details,
-                )
-        details["checks_passed"].append("comments")
+                return _entity_failure(entity, passed_mask, check_name, error)
+            passed_mask |= check_bit
 
         span.set_attribute("firewall.result", "valid")
-        return FirewallResult(is_valid=True, details=details)
+        if collect_details:
+            return FirewallResult(
+                is_valid=True,
+                details=_check_details(
+                    passed_mask, entity_id=entity.entity_id, entity_type=entity.entity_type
+                ),
+                passed_mask=passed_mask,
+            )
+        return _ok_result(passed_mask)
 
 
 def validate_dissemination(
     recipient_id: str,
     recipient_access_level: str,
     highest_classification_sent: str,
-    information_subset: list[str],
+    information_subset: list[str] | EntityBatch,
     is_deception: bool = False,
+    collect_details: bool = False,
 ) -> FirewallResult:
     """
     Validate dissemination decision for security compliance.
@@ -652,6 +1717,7 @@ def validate_dissemination(
     Ensures:
     - Classification level is valid
     - Access level is valid
+    - No entity in an EntityBatch subset exceeds highest_classification_sent
     - Recipient has sufficient access level for data classification
     - Information subset is not empty
     - Special handling for enemy_access (honeypot/deception)
@@ -660,8 +1726,11 @@ def validate_dissemination(
         recipient_id: Recipient identifier.
         recipient_access_level: Recipient's access level.
         highest_classification_sent: Highest classification in transmission.
-        information_subset: List of entity IDs being shared.
+        information_subset: Entity IDs being shared, or an EntityBatch of the
+            entities (which also lets their classifications be checked).
         is_deception: Whether this is disinformation for enemy.
+        collect_details: If True, passing results also carry the details dict.
+            Failures and deception operations always include details.
 
     Returns:
         FirewallResult with validation status and details.
@@ -674,8 +1743,7 @@ def validate_dissemination(
         ...     information_subset=["entity_001"],
         ... )
     """
-    with traced_operation(
-        tracer,
+    with _span(
         "validate_dissemination",
         {
             "recipient_id": recipient_id,
@@ -691,62 +1759,69 @@ def validate_dissemination(
             "entity_count": len(information_subset),
         }
 
+        # Normalize once and map both levels to integer ranks
+        access_level = recipient_access_level.lower()
+        classification = highest_classification_sent.upper()
+        class_code = _CLASSIFICATION_CODE.get(classification)
+        max_code = _ACCESS_MAX_CODE.get(access_level)
+
         # Validate classification level
-        is_valid, error = _check_information_classification_validity(highest_classification_sent)
-        if not is_valid:
+        if class_code is None:
+            _, error = _check_information_classification_validity(highest_classification_sent)
             span.set_attribute("firewall.result", "invalid")
             return FirewallResult(is_valid=False, error=f"[FIREWALL] {error}", details=details)
 
         # Validate access level
-        is_valid, error = _check_access_level_validity(recipient_access_level)
-        if not is_valid:
+        if max_code is None:
+            _, error = _check_access_level_validity(recipient_access_level)
             span.set_attribute("firewall.result", "invalid")
             return FirewallResult(is_valid=False, error=f"[FIREWALL] {error}", details=details)
 
-        # Special case: enemy_access
-        if recipient_access_level.lower() == "enemy_access":
-            # Enemy must ONLY receive UNCLASSIFIED data (unless deception)
-            if highest_classification_sent.upper() != "UNCLASSIFIED":
-                if not is_deception:
-                    span.set_attribute("firewall.result", "blocked")
-                    span.set_attribute("firewall.reason", "enemy_data_leak")
-                    return FirewallResult(
-                        is_valid=False,
-                        error=(
-                            f"[FIREWALL] CRITICAL: Attempting to send {highest_classification_sent} "
-                            f"data to enemy_access recipient WITHOUT deception flag! "
-                            f"This could be a data leak!"
-                        ),
-                        details=details,
-                    )
-                # If is_deception=True, this is intentional disinformation
-                details["deception_operation"] = True
-
-            # Validate information subset for enemy
-            if not information_subset:
-                span.set_attribute("firewall.result", "invalid")
+        # A batch must not carry anything above the declared classification
+        if isinstance(information_subset, EntityBatch):
+            over_classified = information_subset.ids_above(classification)
+            if over_classified:
+                details["over_classified_entities"] = over_classified
+                span.set_attribute("firewall.result", "blocked")
+                span.set_attribute("firewall.reason", "classification_understated")
                 return FirewallResult(
                     is_valid=False,
-                    error="[FIREWALL] Information subset cannot be empty",
+                    error=(
+                        f"[FIREWALL] {len(over_classified)} entities are classified above "
+                        f"the declared '{highest_classification_sent}'"
+                    ),
                     details=details,
                 )
 
-            span.set_attribute("firewall.result", "passed")
-            return FirewallResult(is_valid=True, details=details)
-
-        # Normal access control check (read-down principle)
-        if not can_access_classification(recipient_access_level, highest_classification_sent):
-            span.set_attribute("firewall.result", "blocked")
-            span.set_attribute("firewall.reason", "access_control_violation")
-            return FirewallResult(
-                is_valid=False,
-                error=(
-                    f"[FIREWALL] Access control violation: "
-                    f"Recipient with '{recipient_access_level}' cannot access "
-                    f"'{highest_classification_sent}' data"
-                ),
-                details=details,
-            )
+        # Read-down access control, with enemy_access deception as the one exception
+        if class_code > max_code:
+            if access_level != "enemy_access":
+                span.set_attribute("firewall.result", "blocked")
+                span.set_attribute("firewall.reason", "access_control_violation")
+                return FirewallResult(
+                    is_valid=False,
+                    error=(
+                        f"[FIREWALL] Access control violation: "
+                        f"Recipient with '{recipient_access_level}' cannot access "
+                        f"'{highest_classification_sent}' data"
+                    ),
+                    details=details,
+                )
+            # Enemy must ONLY receive UNCLASSIFIED data (unless deception)
+            if not is_deception:
+                span.set_attribute("firewall.result", "blocked")
+                span.set_attribute("firewall.reason", "enemy_data_leak")
+                return FirewallResult(
+                    is_valid=False,
+                    error=(
+                        f"[FIREWALL] CRITICAL: Attempting to send {highest_classification_sent} "
+                        f"data to enemy_access recipient WITHOUT deception flag! "
+                        f"This could be a data leak!"
+                    ),
+                    details=details,
+                )
+            # If is_deception=True, this is intentional disinformation
+            details["deception_operation"] = True
 
         # Validate information subset
         if not information_subset:
@@ -758,7 +1833,10 @@ def validate_dissemination(
             )
 
         span.set_attribute("firewall.result", "passed")
-        return FirewallResult(is_valid=True, details=details)
+        # Deception operations are always reported in full for auditing
+        if collect_details or "deception_operation" in details:
+            return FirewallResult(is_valid=True, details=details)
+        return _OK_NO_DETAILS
 
 
 # =============================================================================
@@ -766,13 +1844,8 @@ def validate_dissemination(
 # =============================================================================
 
 
-def get_firewall_stats() -> dict[str, int]:
-    """
-    Get statistics about firewall rules.
-
-    Returns:
-        Dictionary with counts of patterns and keywords.
-    """
+def _build_firewall_stats() -> dict[str, int]:
+    """Count the current rules."""
     return {
         "injection_patterns": len(PROMPT_INJECTION_PATTERNS),
         "suspicious_keywords": len(SUSPICIOUS_KEYWORDS),
@@ -780,3 +1853,17 @@ def get_firewall_stats() -> dict[str, int]:
         "classification_levels": len(CLASSIFICATION_LEVEL_SET),
         "access_levels": len(ACCESS_LEVELS),
     }
+
+
+# Rule counts only change on invalidate_validation_cache(), which rebuilds this
+_FIREWALL_STATS: dict[str, int] = _build_firewall_stats()
+
+
+def get_firewall_stats() -> dict[str, int]:
+    """
+    Get statistics about firewall rules.
+
+    Returns:
+        Dictionary with counts of patterns and keywords.
+    """
+    return dict(_FIREWALL_STATS)
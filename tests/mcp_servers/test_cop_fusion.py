@@ -2,13 +2,16 @@
 Tests for MCP Server: COP Fusion
 """
 
+import json
 from datetime import UTC, datetime, timedelta
 
+import numpy as np
 import pytest
 
 from src.mcp_servers.cop_fusion import (
     COPState,
     find_duplicates,
+    find_duplicates_entity,
     get_cop_stats,
     haversine_distance,
     merge_entities,
@@ -16,6 +19,7 @@ from src.mcp_servers.cop_fusion import (
     reset_cop_state,
     update_cop,
 )
+from src.mcp_servers.cop_fusion.tools import _approx_distance_m, _haversine_batch
 from src.models.cop import EntityCOP, Location
 
 # =============================================================================
@@ -124,6 +128,32 @@ class TestHaversineDistance:
         # Should be approximately 150m
         assert 100 < distance < 200
 
+    def test_batch_matches_scalar(self) -> None:
+        """Vectorized kernel should agree with the scalar implementation."""
+        origin = Location(lat=39.4699, lon=-0.3763)
+        points = [Location(lat=40.4168, lon=-3.7038), Location(lat=39.501, lon=-0.401), origin]
+
+        distances = _haversine_batch(
+            origin.lat,
+            origin.lon,
+            np.array([p.lat for p in points]),
+            np.array([p.lon for p in points]),
+        )
+
+        for point, distance in zip(points, distances, strict=True):
+            assert distance == pytest.approx(haversine_distance(origin, point))
+
+    def test_approximation_close_to_haversine(self) -> None:
+        """Equirectangular approximation should track Haversine at short range."""
+        origin = Location(lat=39.5, lon=179.999)
+        nearby = Location(lat=39.501, lon=-179.999)  # across the antimeridian
+
+        approx = _approx_distance_m(
+            origin.lat, origin.lon, np.array([nearby.lat]), np.array([nearby.lon])
+        )
+
+        assert approx[0] == pytest.approx(haversine_distance(origin, nearby), rel=1e-3)
+
 
 # =============================================================================
 # COPState Tests
@@ -181,6 +211,18 @@ class TestCOPState:
 
         assert result == "updated"
 
+    def test_upsert_entities_batch(
+        self, cop_state: COPState, sample_aircraft: EntityCOP, sample_ship: EntityCOP
+    ) -> None:
+        """Batch upsert should report per-entity actions in order."""
+        cop_state.add_entity(sample_ship)
+        moved = sample_aircraft.model_copy(update={"confidence": 0.95})
+
+        actions = cop_state.upsert_entities([sample_aircraft, sample_ship, moved])
+
+        assert actions == ["added", "updated", "updated"]
+        assert cop_state.entities[sample_aircraft.entity_id].confidence == 0.95
+
     def test_remove_entity(self, cop_state: COPState, sample_aircraft: EntityCOP) -> None:
         """Should remove entity from COP."""
         cop_state.add_entity(sample_aircraft)
@@ -189,6 +231,80 @@ class TestCOPState:
         assert result is True
         assert sample_aircraft.entity_id not in cop_state.entities
 
+    def test_coordinate_index_buckets_by_type(self, populated_cop: COPState) -> None:
+        """Coordinate index should be per entity type and filter by latitude band."""
+        index = populated_cop.coordinate_index("aircraft")
+
+        assert index is not None
+        assert [e.entity_id for e in index.entities] == ["aircraft_001"]
+        assert index.within_lat_band(39.5, 0.01).tolist() == [0]
+        assert index.within_lat_band(39.0, 0.01).tolist() == []
+        assert populated_cop.coordinate_index("vehicle") is None
+
+    def test_coordinate_index_tracks_mutations(self, sample_aircraft: EntityCOP) -> None:
+        """Incrementally updated buckets should match a freshly built index."""
+        cop_state = COPState(auto_sync=False)
+        cop_state.coordinate_index("aircraft")
+        for i in range(200):
+            cop_state.upsert_entity(
+                sample_aircraft.model_copy(
+                    update={
+                        "entity_id": f"e{i % 40}",
+                        "entity_type": ("aircraft", "ship")[i % 3 == 0],
+                        "location": Location(lat=39.0 + (i % 7) / 10, lon=-0.4),
+                    }
+                )
+            )
+            if i % 5 == 0:
+                cop_state.remove_entity(f"e{(i * 3) % 40}")
+
+        fresh = COPState(auto_sync=False)
+        fresh.upsert_entities(list(cop_state.entities.values()))
+        for entity_type in ("aircraft", "ship"):
+            index = cop_state.coordinate_index(entity_type)
+            expected = fresh.coordinate_index(entity_type)
+            assert index is not None and expected is not None
+            band = index.within_lat_band(39.3, 0.15).tolist()
+            assert [index.entities[i].entity_id for i in band] == [
+                expected.entities[i].entity_id for i in expected.within_lat_band(39.3, 0.15)
+            ]
+            assert sorted(e.entity_id for e in index.entities) == sorted(
+                e.entity_id for e in expected.entities
+            )
+
+    def test_coordinate_index_tracks_batch_upserts(self, sample_aircraft: EntityCOP) -> None:
+        """Batches merged into existing buckets should match a freshly built index."""
+        cop_state = COPState(auto_sync=False)
+        cop_state.coordinate_index("aircraft")
+        for batch in range(5):
+            cop_state.upsert_entities(
+                [
+                    sample_aircraft.model_copy(
+                        update={
+                            "entity_id": f"e{(i * 7 + batch) % 30}",
+                            "entity_type": ("aircraft", "ship")[(i + batch) % 3 == 0],
+                            "location": Location(lat=39.0 + (i % 9) / 10, lon=-0.4),
+                        }
+                    )
+                    for i in range(25)
+                ]
+            )
+            cop_state.remove_entity(f"e{batch}")
+
+        fresh = COPState(auto_sync=False)
+        fresh.upsert_entities(list(cop_state.entities.values()))
+        for entity_type in ("aircraft", "ship"):
+            index = cop_state.coordinate_index(entity_type)
+            expected = fresh.coordinate_index(entity_type)
+            assert index is not None and expected is not None
+            assert [index.entities[i].entity_id for i in index.within_lat_band(39.4, 0.25)] == [
+                expected.entities[i].entity_id for i in expected.within_lat_band(39.4, 0.25)
+            ]
+            assert index.lats.tolist() == sorted(index.lats.tolist())
+            assert sorted(e.entity_id for e in index.entities) == sorted(
+                e.entity_id for e in expected.entities
+            )
+
     def test_create_snapshot(self, populated_cop: COPState) -> None:
         """Should create snapshot of current state."""
         snapshot = populated_cop.create_snapshot()
@@ -230,6 +346,37 @@ class TestFindDuplicates:
         assert result["matches"][0]["entity_id"] == "aircraft_001"
         assert result["matches"][0]["distance_m"] < 200
 
+    def test_reflects_state_mutations(
+        self,
+        populated_cop: COPState,
+        sample_aircraft: EntityCOP,
+        sample_aircraft_nearby: EntityCOP,
+    ) -> None:
+        """Coordinate columns should be rebuilt after entities move or leave."""
+        query = sample_aircraft_nearby
+        assert len(find_duplicates_entity(populated_cop, query)["matches"]) == 1
+
+        moved = sample_aircraft.model_copy(update={"location": Location(lat=41.0, lon=2.0)})
+        populated_cop.update_entity(moved)
+        assert find_duplicates_entity(populated_cop, query)["matches"] == []
+
+        populated_cop.update_entity(sample_aircraft)
+        assert len(find_duplicates_entity(populated_cop, query)["matches"]) == 1
+
+        populated_cop.remove_entity(sample_aircraft.entity_id)
+        assert find_duplicates_entity(populated_cop, query)["matches"] == []
+
+    def test_entity_and_payload_paths_agree(
+        self,
+        populated_cop: COPState,
+        sample_aircraft_nearby: EntityCOP,
+    ) -> None:
+        """Model input should give the same result as its serialized payload."""
+        from_model = find_duplicates_entity(populated_cop, sample_aircraft_nearby)
+        from_payload = find_duplicates(populated_cop, sample_aircraft_nearby.model_dump_json_safe())
+
+        assert from_model == from_payload
+
     def test_no_duplicates_for_different_type(
         self,
         populated_cop: COPState,
@@ -264,10 +411,7 @@ class TestFindDuplicates:
             source_sensors=["radar_03"],
         )
 
-        result = find_duplicates(
-            cop_state=populated_cop,
-            entity_data=far_aircraft.model_dump_json_safe(),
-        )
+        result = find_duplicates_entity(cop_state=populated_cop, entity=far_aircraft)
 
         assert len(result["matches"]) == 0
 
@@ -281,9 +425,9 @@ class TestFindDuplicates:
             source_sensors=["radar_03"],
         )
 
-        result = find_duplicates(
+        result = find_duplicates_entity(
             cop_state=populated_cop,
-            entity_data=old_aircraft.model_dump_json_safe(),
+            entity=old_aircraft,
             time_window_sec=300,
         )
 
@@ -439,6 +583,35 @@ class TestUpdateCOP:
         assert result["added"] == 0
         assert result["updated"] == 1
 
+    def test_accepts_raw_json(self, cop_state: COPState) -> None:
+        """Should decode a JSON payload and share cached timestamps and sensor IDs."""
+        payload = json.dumps(
+            [
+                {
+                    "entity_id": f"test_00{i}",
+                    "entity_type": "aircraft",
+                    "location": {"lat": 39.5, "lon": -0.4 + i / 100},
+                    "timestamp": "2025-10-15T14:30:00Z",
+                    "source_sensors": ["radar_01"],
+                }
+                for i in range(2)
+            ]
+        ).encode()
+
+        result = update_cop(cop_state=cop_state, entities_data=payload)
+
+        assert result["added"] == 2
+        first, second = cop_state.entities.values()
+        assert first.timestamp == datetime(2025, 10, 15, 14, 30, tzinfo=UTC)
+        assert first.timestamp is second.timestamp
+        assert first.source_sensors[0] is second.source_sensors[0]
+
+    def test_rejects_malformed_json(self, cop_state: COPState) -> None:
+        """Should report undecodable or non-list JSON payloads."""
+        assert "error" in update_cop(cop_state=cop_state, entities_data="[{")
+        assert "error" in update_cop(cop_state=cop_state, entities_data='{"entity_id": "x"}')
+        assert len(cop_state.entities) == 0
+
     def test_handles_invalid_data(self, cop_state: COPState) -> None:
         """Should handle invalid entity data gracefully."""
         entities_data = [
@@ -508,6 +681,36 @@ class TestQueryCOP:
 
         assert result["count"] == 1
 
+    def test_query_reflects_state_changes(
+        self, populated_cop: COPState, sample_aircraft: EntityCOP
+    ) -> None:
+        """Filters should see entities updated or removed after an earlier query."""
+        assert query_cop(cop_state=populated_cop, min_confidence=0.85)["count"] == 1
+
+        populated_cop.update_entity(sample_aircraft.model_copy(update={"confidence": 0.9}))
+        assert query_cop(cop_state=populated_cop, min_confidence=0.85)["count"] == 2
+
+        populated_cop.remove_entity("ship_001")
+        result = query_cop(cop_state=populated_cop, min_confidence=0.85)
+        assert [e["entity_id"] for e in result["entities"]] == ["aircraft_001"]
+
+    def test_query_matches_dict_order_across_churn(self, sample_aircraft: EntityCOP) -> None:
+        """Columns should track interleaved upserts and removals, including compaction."""
+        cop_state = COPState(auto_sync=False)
+        for i in range(600):
+            cop_state.upsert_entity(
+                sample_aircraft.model_copy(
+                    update={"entity_id": f"a{i % 200}", "confidence": (i % 10) / 10}
+                )
+            )
+            if i >= 200:
+                cop_state.remove_entity(f"a{(i * 7) % 200}")
+            if i % 50 == 49:
+                expected = [e.entity_id for e in cop_state.entities.values() if e.confidence >= 0.5]
+                result = query_cop(cop_state=cop_state, min_confidence=0.5, limit=1000)
+                assert [e["entity_id"] for e in result["entities"]] == expected
+                assert result["total_in_cop"] == len(cop_state.entities)
+
 
 # =============================================================================
 # get_cop_stats Tool Tests
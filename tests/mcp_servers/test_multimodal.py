@@ -6,7 +6,9 @@ Full integration tests require external dependencies (Whisper, VLM APIs).
 """
 
 import os
-import tempfile
+from pathlib import Path
+
+import pytest
 
 from src.mcp_servers.multimodal.audio_tools import is_audio_file, validate_audio_file
 from src.mcp_servers.multimodal.document_tools import (
@@ -14,12 +16,47 @@ from src.mcp_servers.multimodal.document_tools import (
     is_document_file,
     validate_document_file,
 )
+from src.mcp_servers.multimodal.file_types import (
+    FileKind,
+    FileRef,
+    classify_file,
+    file_ref,
+)
 from src.mcp_servers.multimodal.image_tools import (
     get_image_mime_type,
     is_image_file,
     validate_image_file,
 )
 
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+# Sample file name -> content, written once per test session
+_SAMPLE_FILES: dict[str, bytes] = {
+    "unsupported.xyz": b"test content",
+    "audio.mp3": b"fake audio content",
+    "report.txt": b"This is a test document.\nWith multiple lines.",
+    "empty.txt": b"",
+    "latin1.txt": b"Caf\xe9 report\r\nLine two\rLine three",
+    "first.txt": b"first document",
+    "second.txt": b"second document",
+    "utf8.txt": "Café crème".encode(),
+}
+
+
+@pytest.fixture(scope="session")
+def sample_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """Create the read-only sample files once and map their names to paths."""
+    directory = tmp_path_factory.mktemp("multimodal_samples")
+    paths: dict[str, str] = {}
+    for name, content in _SAMPLE_FILES.items():
+        path = directory / name
+        path.write_bytes(content)
+        paths[name] = str(path)
+    return paths
+
+
 # =============================================================================
 # Audio Tools Tests
 # =============================================================================
@@ -48,37 +85,28 @@ class TestAudioValidation:
         """PNG should not be recognized as audio."""
         assert is_audio_file("test.png") is False
 
+    def test_is_audio_file_uses_final_extension(self) -> None:
+        """Only the last extension counts, case-insensitively."""
+        assert is_audio_file("/data/clips.mp3/REPORT.WAV") is True
+        assert is_audio_file("/data/clips.mp3/notes") is False
+
     def test_validate_audio_file_not_found(self) -> None:
         """Validation should fail for non-existent file."""
         is_valid, error = validate_audio_file("/nonexistent/file.mp3")
         assert is_valid is False
         assert "not found" in error.lower()
 
-    def test_validate_audio_file_unsupported_format(self) -> None:
+    def test_validate_audio_file_unsupported_format(self, sample_files: dict[str, str]) -> None:
         """Validation should fail for unsupported format."""
-        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as f:
-            f.write(b"test content")
-            temp_path = f.name
-
-        try:
-            is_valid, error = validate_audio_file(temp_path)
-            assert is_valid is False
-            assert "unsupported" in error.lower()
-        finally:
-            os.unlink(temp_path)
-
-    def test_validate_audio_file_valid(self) -> None:
-        """Validation should pass for valid audio file."""
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-            f.write(b"fake audio content")
-            temp_path = f.name
+        is_valid, error = validate_audio_file(sample_files["unsupported.xyz"])
+        assert is_valid is False
+        assert "unsupported" in error.lower()
 
-        try:
-            is_valid, error = validate_audio_file(temp_path)
-            assert is_valid is True
-            assert error is None
-        finally:
-            os.unlink(temp_path)
+    def test_validate_audio_file_valid(self, sample_files: dict[str, str]) -> None:
+        """Validation should pass for valid audio file."""
+        is_valid, error = validate_audio_file(sample_files["audio.mp3"])
+        assert is_valid is True
+        assert error is None
 
 
 # =============================================================================
@@ -119,18 +147,30 @@ class TestImageValidation:
         assert is_valid is False
         assert "not found" in error.lower()
 
-    def test_validate_image_file_unsupported_format(self) -> None:
+    def test_validate_image_file_unsupported_format(self, sample_files: dict[str, str]) -> None:
         """Validation should fail for unsupported format."""
-        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as f:
-            f.write(b"test content")
-            temp_path = f.name
+        is_valid, error = validate_image_file(sample_files["unsupported.xyz"])
+        assert is_valid is False
+        assert "unsupported" in error.lower()
+
+    def test_validate_image_file_tracks_file_changes(self, tmp_path: Path) -> None:
+        """Validation should follow size changes and deletion of the file."""
+        image = tmp_path / "photo.png"
+        image.write_bytes(b"png")
+        temp_path = str(image)
+
+        assert validate_image_file(temp_path) == (True, None)
+        assert validate_image_file(temp_path) == (True, None)
+
+        os.truncate(temp_path, 21 * 1024 * 1024)
+        is_valid, error = validate_image_file(temp_path)
+        assert is_valid is False
+        assert "too large" in error.lower()
 
-        try:
-            is_valid, error = validate_image_file(temp_path)
-            assert is_valid is False
-            assert "unsupported" in error.lower()
-        finally:
-            os.unlink(temp_path)
+        image.unlink()
+        is_valid, error = validate_image_file(temp_path)
+        assert is_valid is False
+        assert "not found" in error.lower()
 
     def test_get_image_mime_type_jpg(self) -> None:
         """JPG should return image/jpeg MIME type."""
@@ -179,18 +219,11 @@ class TestDocumentValidation:
         assert is_valid is False
         assert "not found" in error.lower()
 
-    def test_validate_document_file_unsupported_format(self) -> None:
+    def test_validate_document_file_unsupported_format(self, sample_files: dict[str, str]) -> None:
         """Validation should fail for unsupported format."""
-        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as f:
-            f.write(b"test content")
-            temp_path = f.name
-
-        try:
-            is_valid, error = validate_document_file(temp_path)
-            assert is_valid is False
-            assert "unsupported" in error.lower()
-        finally:
-            os.unlink(temp_path)
+        is_valid, error = validate_document_file(sample_files["unsupported.xyz"])
+        assert is_valid is False
+        assert "unsupported" in error.lower()
 
 
 class TestCleanExtractedText:
@@ -221,6 +254,11 @@ class TestCleanExtractedText:
         lines = cleaned.split("\n")
         assert len(lines) <= 12  # 10 lines + truncation message
 
+    def test_clean_blank_line_edges(self) -> None:
+        """Leading blank lines are dropped; a trailing run leaves one empty line."""
+        assert clean_extracted_text("\n \n\tA\t\n\n\n\nB \n\n") == "A\n\nB\n"
+        assert clean_extracted_text(" \n\t\n ") == ""
+
     def test_clean_empty_text(self) -> None:
         """Should handle empty text."""
         assert clean_extracted_text("") == ""
@@ -230,36 +268,66 @@ class TestCleanExtractedText:
 class TestDocumentExtraction:
     """Tests for document text extraction."""
 
-    def test_extract_txt_file(self) -> None:
+    def test_extract_txt_file(self, sample_files: dict[str, str]) -> None:
         """Should extract text from TXT file."""
         from src.mcp_servers.multimodal.document_tools import process_document
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False, mode="w") as f:
-            f.write("This is a test document.\nWith multiple lines.")
-            temp_path = f.name
-
-        try:
-            result = process_document(temp_path)
-            assert result["success"] is True
-            assert "test document" in result["text"]
-            assert result["format"] == "txt"
-        finally:
-            os.unlink(temp_path)
+        result = process_document(sample_files["report.txt"])
+        assert result["success"] is True
+        assert "test document" in result["text"]
+        assert result["format"] == "txt"
 
-    def test_extract_empty_file(self) -> None:
+    def test_extract_empty_file(self, sample_files: dict[str, str]) -> None:
         """Should handle empty file gracefully."""
         from src.mcp_servers.multimodal.document_tools import process_document
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False, mode="w") as f:
-            f.write("")
-            temp_path = f.name
+        result = process_document(sample_files["empty.txt"])
+        assert result["success"] is False
+        assert "empty" in result["error"].lower()
+
+    def test_extract_txt_fallback_encoding_and_newlines(self, sample_files: dict[str, str]) -> None:
+        """Non-UTF-8 bytes should fall back to latin-1 with newlines normalized."""
+        from src.mcp_servers.multimodal.document_tools import process_document
+
+        result = process_document(sample_files["latin1.txt"])
+        assert result["success"] is True
+        assert result["text"] == "Café report\nLine two\nLine three"
+
+    def test_extract_txt_respects_byte_cap(
+        self, sample_files: dict[str, str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Only the first MAX_TEXT_BYTES bytes of a TXT file should be decoded."""
+        from src.mcp_servers.multimodal import document_tools
+
+        monkeypatch.setattr(document_tools, "MAX_TEXT_BYTES", 14)
+        result = document_tools.process_document(sample_files["report.txt"])
+        assert result["text"] == "This is a test"
+
+    def test_extract_txt_cap_inside_multibyte_character(
+        self,
+        sample_files: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """A cap that splits a UTF-8 character should drop it, not fall back to latin-1."""
+        from src.mcp_servers.multimodal import document_tools
 
-        try:
-            result = process_document(temp_path)
-            assert result["success"] is False
-            assert "empty" in result["error"].lower()
-        finally:
-            os.unlink(temp_path)
+        monkeypatch.setattr(document_tools, "MAX_TEXT_BYTES", 4)
+        with caplog.at_level("WARNING", logger=document_tools.logger.name):
+            result = document_tools.process_document(sample_files["utf8.txt"])
+
+        assert result["text"] == "Caf"
+        assert "Truncating utf8.txt" in caplog.text
+
+    def test_process_documents_preserves_order(self, sample_files: dict[str, str]) -> None:
+        """Batch processing should return one result per path, in order."""
+        from src.mcp_servers.multimodal.document_tools import process_documents
+
+        paths = [sample_files["first.txt"], sample_files["second.txt"]]
+        results = process_documents([*paths, "/nonexistent/missing.txt"])
+        assert [r["text"] for r in results[:2]] == ["first document", "second document"]
+        assert results[2]["success"] is False
+        assert process_documents([*paths, "/nonexistent/missing.txt"], max_workers=1) == results
 
 
 # =============================================================================
@@ -293,3 +361,23 @@ class TestFileTypeDetection:
             assert is_document_file(f) is True
             assert is_audio_file(f) is False
             assert is_image_file(f) is False
+
+    def test_classify_file(self) -> None:
+        """classify_file should map each extension to one kind, case-insensitively."""
+        assert classify_file("report.PDF") is FileKind.DOCUMENT
+        assert classify_file("clip.Mp3") is FileKind.AUDIO
+        assert classify_file("photo.jpeg") is FileKind.IMAGE
+        assert classify_file("archive.zip") is FileKind.UNSUPPORTED
+        assert classify_file("README") is FileKind.UNSUPPORTED
+
+    def test_file_ref_is_accepted_by_tools(self, sample_files: dict[str, str]) -> None:
+        """A FileRef should behave like its path in every check."""
+        ref = file_ref("/data/Photo.PNG")
+        assert ref == FileRef("/data/Photo.PNG", ".png")
+        assert file_ref(ref) is ref
+        assert is_image_file(ref) is True
+        assert get_image_mime_type(ref) == "image/png"
+
+        audio = file_ref(sample_files["audio.mp3"])
+        assert validate_audio_file(audio) == validate_audio_file(audio.path)
+        assert validate_image_file(audio)[0] is False
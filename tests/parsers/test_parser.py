@@ -2,15 +2,20 @@
 Tests for CopForge parsers.
 """
 
+import json
+import sys
 from datetime import UTC, datetime
 
 import pytest
+from pydantic import ValidationError
 
-from src.models.sensor import SensorMessage
+from src.models.sensor import SensorMessage, decode_sensor_message, decode_sensor_messages
 from src.parsers import (
     ASTERIXParser,
+    BaseParser,
     DroneParser,
     ManualParser,
+    ParserFactory,
     RadioParser,
     get_parser_factory,
 )
@@ -244,3 +249,127 @@ class TestParserFactory:
 
         assert "ASTERIXParser" in parser_names
         assert "DroneParser" in parser_names
+
+    def test_parse_decoded_json_message(self, asterix_message: SensorMessage) -> None:
+        """Messages decoded from JSON should parse like constructed ones."""
+        raw = json.dumps({**asterix_message.model_dump_json_safe(), "sensor_type": "RADAR"})
+
+        decoded = decode_sensor_message(raw)
+        result = get_parser_factory().parse(decoded)
+
+        assert decoded == asterix_message
+        assert decode_sensor_messages(f"[{raw}, {raw}]") == [decoded, decoded]
+        assert result.success is True
+        with pytest.raises(ValidationError):
+            decode_sensor_message(b'{"sensor_id": "radar_01", "sensor_type": "sonar"}')
+
+    def test_decoded_sensor_fields_are_interned(self, asterix_message: SensorMessage) -> None:
+        """Decoded sensor IDs and types should be the interned string objects."""
+        raw = json.dumps({**asterix_message.model_dump_json_safe(), "sensor_type": "RADAR"})
+
+        decoded = decode_sensor_message(raw)
+
+        assert decoded.sensor_id is sys.intern(asterix_message.sensor_id)
+        assert decoded.sensor_type is sys.intern("radar")
+
+    def test_parsers_are_read_only(self, drone_message: SensorMessage) -> None:
+        """The parser list should only change through register_parser."""
+        factory = ParserFactory()
+        assert isinstance(factory.get_parser(drone_message), DroneParser)
+
+        with pytest.raises(AttributeError):
+            factory.parsers.append(ManualParser())  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            factory.parsers = ()  # type: ignore[misc]
+
+        extra = DroneParser()
+        factory.register_parser(extra)
+        assert factory.parsers[-1] is extra
+        assert isinstance(factory.get_parser(drone_message), DroneParser)
+
+    def test_get_parser_factory_is_singleton(self) -> None:
+        """Repeated calls should return the same factory instance."""
+        assert get_parser_factory() is get_parser_factory()
+
+    def test_default_can_parse_checks_sensor_types(
+        self, asterix_message: SensorMessage, drone_message: SensorMessage
+    ) -> None:
+        """Parsers that only set SENSOR_TYPES should accept exactly those types."""
+
+        class RadarOnlyParser(ManualParser):
+            SENSOR_TYPES = frozenset({"radar"})
+            can_parse = BaseParser.can_parse
+
+        parser = RadarOnlyParser()
+        assert parser.can_parse(asterix_message) is True
+        assert parser.can_parse(drone_message) is False
+        assert ASTERIXParser().can_parse(drone_message) is False
+
+    def test_missing_sensor_types_accepts_nothing(
+        self, asterix_message: SensorMessage, drone_message: SensorMessage
+    ) -> None:
+        """A parser that forgets SENSOR_TYPES should reject every message."""
+
+        class UntypedParser(ManualParser):
+            SENSOR_TYPES = BaseParser.SENSOR_TYPES
+            can_parse = BaseParser.can_parse
+
+        parser = UntypedParser()
+        assert parser.can_parse(asterix_message) is False
+        assert parser.can_parse(drone_message) is False
+
+        factory = ParserFactory()
+        factory.register_parser(parser)
+        for sensor_type in ("radar", "drone", "radio", "manual"):
+            assert parser not in factory._parsers_for_type(sensor_type)
+
+    def test_custom_parser_without_sensor_types_still_dispatched(
+        self, asterix_message: SensorMessage
+    ) -> None:
+        """A custom can_parse() without SENSOR_TYPES should still be offered messages."""
+
+        class AcousticParser(ManualParser):
+            SENSOR_TYPES = BaseParser.SENSOR_TYPES
+
+            def can_parse(self, sensor_msg: SensorMessage) -> bool:
+                return sensor_msg.sensor_type == "acoustic"
+
+        acoustic_message = SensorMessage(
+            sensor_id="sonar_01",
+            sensor_type="acoustic",
+            timestamp=datetime.now(UTC),
+            data={"bearing": 45.0},
+        )
+        factory = ParserFactory()
+        assert factory.get_parser(acoustic_message) is None
+
+        parser = AcousticParser()
+        factory.register_parser(parser)
+        assert factory.get_parser(acoustic_message) is parser
+        assert isinstance(factory.get_parser(asterix_message), ASTERIXParser)
+
+    def test_dispatch_by_sensor_type(
+        self, asterix_message: SensorMessage, drone_message: SensorMessage
+    ) -> None:
+        """Only parsers listing the message's sensor type should be tried."""
+
+        class AISParser(ManualParser):
+            SENSOR_TYPES = frozenset({"ais"})
+
+            def can_parse(self, sensor_msg: SensorMessage) -> bool:
+                return isinstance(sensor_msg.data, dict)
+
+        ais_message = SensorMessage(
+            sensor_id="ais_01",
+            sensor_type="ais",
+            timestamp=datetime.now(UTC),
+            data={"mmsi": 224000000},
+        )
+        factory = ParserFactory()
+        assert isinstance(factory.get_parser(asterix_message), ASTERIXParser)
+        assert factory.get_parser(ais_message) is None
+
+        ais_parser = AISParser()
+        factory.register_parser(ais_parser)
+        assert isinstance(factory.get_parser(drone_message), DroneParser)
+        assert factory.get_parser(ais_message) is ais_parser